@@ -6,10 +6,12 @@ Enhanced with swarm intelligence and hive mind capabilities
 
 import asyncio
 import json
-from typing import Dict, List, Optional, Any, Union
+from collections import deque
+from typing import Deque, Dict, List, Optional, Any, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import logging
+import threading
 import time
 from pathlib import Path
 from prometheus_client import Counter, Histogram, Gauge, Summary, start_http_server
@@ -65,6 +67,10 @@ class AgentManager:
     decision_latency = Summary('decision_making_duration_seconds', 'Time to reach consensus')
     error_rate = Counter('agent_errors_total', 'Total agent errors', ['error_type', 'agent_id'])
     
+    # Shared instance handed out by default()
+    _default: Optional["AgentManager"] = None
+    _default_lock = threading.Lock()
+    
     def __init__(self, config_path: Optional[Path] = None, swarm_hive_coordinator=None):
         # Setup structured logging
         structlog.configure(
@@ -88,8 +94,19 @@ class AgentManager:
         
         self.active_agents: Dict[str, AgentConfiguration] = {}
         self.agent_registry: Dict[str, AgentConfiguration] = {}
+        self.registry_generation = 0  # Bumped on every registry mutation
+        self._category_index: Dict[str, List[str]] = {}
+        self._category_index_generation = -1
         self.coordination_patterns: Dict[str, Any] = {}
-        self.decision_history: List[Dict[str, Any]] = []
+        # Recent coordination decisions, bounded so long-running managers don't grow without limit
+        self.decision_history: Deque[Dict[str, Any]] = deque(maxlen=1000)
+        
+        # Rolling decision stats, updated per decision so readers never scan the history
+        self.decisions_total = 0
+        self._recent_failures: Deque[bool] = deque(maxlen=10)
+        self._recent_failure_count = 0
+        self._recent_durations: Deque[float] = deque(maxlen=5)
+        self._recent_duration_sum = 0.0
         
         # Swarm-Hive integration
         self.swarm_hive_coordinator = swarm_hive_coordinator
@@ -101,6 +118,15 @@ class AgentManager:
         else:
             self.initialize_default_registry()
     
+    @classmethod
+    def default(cls) -> "AgentManager":
+        """Get the process-wide manager with the default registry, creating it on first use"""
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = cls()
+        return cls._default
+    
     def initialize_default_registry(self):
         """Initialize the core agent registry with default configurations"""
         
@@ -245,6 +271,23 @@ class AgentManager:
         all_agents = core_agents + development_agents + treeai_agents
         for agent in all_agents:
             self.agent_registry[agent.agent_id] = agent
+        self.registry_generation += 1
+    
+    def register_agent(self, agent: AgentConfiguration):
+        """
+        Add or replace an agent in the registry
+        """
+        self.agent_registry[agent.agent_id] = agent
+        self.registry_generation += 1
+    
+    def unregister_agent(self, agent_id: str) -> bool:
+        """
+        Remove an agent from the registry
+        """
+        if self.agent_registry.pop(agent_id, None) is None:
+            return False
+        self.registry_generation += 1
+        return True
     
     async def activate_agent(self, agent_id: str, task_context: Dict[str, Any]) -> Optional[AgentConfiguration]:
         """
@@ -305,9 +348,45 @@ class AgentManager:
             "result": coordination_result,
             "timestamp": asyncio.get_event_loop().time()
         })
+        self._record_decision_stats(coordination_result)
         
         return coordination_result
     
+    def _record_decision_stats(self, result: Dict[str, Any]):
+        """
+        Fold one decision into the rolling success (last 10) and duration (last 5) windows
+        """
+        self.decisions_total += 1
+        
+        failed = 'error' in result
+        if len(self._recent_failures) == self._recent_failures.maxlen:
+            self._recent_failure_count -= self._recent_failures[0]
+        self._recent_failures.append(failed)
+        self._recent_failure_count += failed
+        
+        duration = result.get('duration', 0)
+        if len(self._recent_durations) == self._recent_durations.maxlen:
+            self._recent_duration_sum -= self._recent_durations[0]
+        self._recent_durations.append(duration)
+        self._recent_duration_sum += duration
+    
+    @property
+    def recent_decision_count(self) -> int:
+        """Number of decisions in the success-rate window"""
+        return len(self._recent_failures)
+    
+    @property
+    def recent_success_rate(self) -> float:
+        """Share of the last 10 decisions without an error (1.0 before any decision)"""
+        count = len(self._recent_failures)
+        return (count - self._recent_failure_count) / count if count else 1.0
+    
+    @property
+    def recent_avg_duration(self) -> float:
+        """Mean coordination duration over the last 5 decisions"""
+        count = len(self._recent_durations)
+        return self._recent_duration_sum / count if count else 0.0
+    
     async def democratic_coordination(self, agents: List[AgentConfiguration], task: Dict[str, Any]) -> Dict[str, Any]:
         """
         Implement democratic decision-making among agents
@@ -449,6 +528,7 @@ class AgentManager:
             for agent_data in config_data.get('agents', []):
                 agent_config = AgentConfiguration(**agent_data)
                 self.agent_registry[agent_config.agent_id] = agent_config
+            self.registry_generation += 1
                 
         except Exception as e:
             self.logger.error(f"Failed to load configuration: {e}")
@@ -460,6 +540,21 @@ class AgentManager:
         """
         return self.active_agents.copy()
     
+    def get_agents_by_category(self, category: str) -> List[str]:
+        """
+        Agent ids whose specialization domains include the category, in registry order
+        """
+        if self._category_index_generation != self.registry_generation:
+            index: Dict[str, List[str]] = {}
+            for agent_id, agent_config in self.agent_registry.items():
+                if agent_config.capabilities:
+                    for domain in set(agent_config.capabilities.specialization_domains):
+                        index.setdefault(domain, []).append(agent_id)
+            self._category_index = index
+            self._category_index_generation = self.registry_generation
+        
+        return self._category_index.get(category, [])
+    
     def get_agent_registry(self) -> Dict[str, AgentConfiguration]:
         """
         Get the complete agent registry
@@ -0,0 +1,159 @@
+"""
+Typed parameter schemas for daemon bridge actions
+One slotted dataclass per action; decode_params turns the raw params object of
+a command into an instance, validated by msgspec when it is installed and by
+a plain keyword construction otherwise.
+"""
+
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Optional
+
+try:
+    import msgspec
+except ImportError:  # plain construction, without type checks
+    msgspec = None
+
+
+@dataclass(slots=True)
+class SwarmCreateParams:
+    id: Optional[str] = None
+    topology: str = "adaptive"
+    agents: List[str] = field(default_factory=list)
+    task: str = ""
+
+
+@dataclass(slots=True)
+class SwarmExecuteParams:
+    swarm_id: Optional[str] = None
+    task: str = ""
+    timeout: float = 300
+    background: bool = False
+
+
+@dataclass(slots=True)
+class SwarmStatusParams:
+    swarm_id: Optional[str] = None
+
+
+@dataclass(slots=True)
+class SwarmDissolveParams:
+    swarm_id: Optional[str] = None
+    save_results: bool = False
+
+
+@dataclass(slots=True)
+class SwarmListParams:
+    detailed: bool = False
+
+
+@dataclass(slots=True)
+class HiveInitParams:
+    agents: List[str] = field(default_factory=list)
+    capabilities: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class HiveDecideParams:
+    question: str = ""
+    options: List[Any] = field(default_factory=list)
+    method: str = "consensus"
+    timeout: float = 300
+
+
+@dataclass(slots=True)
+class HiveRememberParams:
+    content: Any = ""
+    memory_type: str = "semantic"
+    contributors: List[str] = field(default_factory=list)
+    confidence: float = 0.8
+
+
+@dataclass(slots=True)
+class HiveRecallParams:
+    query: str = ""
+    memory_type: Optional[str] = None
+    min_confidence: float = 0.5
+
+
+@dataclass(slots=True)
+class HiveStatusParams:
+    nodes: bool = False
+    memory: bool = False
+    decisions: bool = False
+
+
+@dataclass(slots=True)
+class CollaborateParams:
+    task: str = ""
+    agents: str = ""  # Comma separated agent ids
+    mode: str = "adaptive_selection"
+    topology: str = "adaptive"
+    background: bool = False
+    timeout: Optional[float] = None
+
+
+@dataclass(slots=True)
+class AgentListParams:
+    category: Optional[str] = None
+    available: bool = True
+    active: bool = False
+
+
+@dataclass(slots=True)
+class AgentInfoParams:
+    agent: Optional[str] = None
+    capabilities: bool = False
+    status: bool = False
+
+
+@dataclass(slots=True)
+class TaskStatusParams:
+    task_id: Optional[str] = None
+
+
+ACTION_PARAMS: Dict[str, type] = {
+    "swarm_create": SwarmCreateParams,
+    "swarm_execute": SwarmExecuteParams,
+    "swarm_status": SwarmStatusParams,
+    "swarm_dissolve": SwarmDissolveParams,
+    "swarm_list": SwarmListParams,
+
+    "hive_init": HiveInitParams,
+    "hive_decide": HiveDecideParams,
+    "hive_remember": HiveRememberParams,
+    "hive_recall": HiveRecallParams,
+    "hive_status": HiveStatusParams,
+
+    "collaborate": CollaborateParams,
+    "agent_list": AgentListParams,
+    "agent_info": AgentInfoParams,
+    "task_status": TaskStatusParams,
+}
+
+# Field names per schema for the fallback path, which drops unknown keys like msgspec does
+_FIELD_NAMES = {
+    schema: frozenset(f.name for f in fields(schema))
+    for schema in ACTION_PARAMS.values()
+}
+
+
+class InvalidParams(ValueError):
+    """Raised when a command's params do not match its action schema"""
+
+
+def decode_params(schema: type, params: Any):
+    """Build the schema instance for a command's params"""
+    if params is None:
+        return schema()
+    if not isinstance(params, dict):
+        raise InvalidParams(f"params must be an object, got {type(params).__name__}")
+
+    if msgspec is not None:
+        try:
+            # Lax mode keeps accepting e.g. "30" for a numeric timeout
+            return msgspec.convert(params, schema, strict=False)
+        except msgspec.ValidationError as e:
+            raise InvalidParams(str(e)) from None
+
+    names = _FIELD_NAMES[schema]
+    return schema(**{key: value for key, value in params.items() if key in names})
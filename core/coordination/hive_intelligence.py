@@ -7,6 +7,9 @@ import asyncio
 import json
 import time
 import hashlib
+import heapq
+import itertools
+from operator import attrgetter
 from typing import Dict, List, Optional, Any, Union, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
@@ -83,6 +86,9 @@ class HiveIntelligence:
         self.memory_store: Dict[str, HiveMemoryFragment] = {}
         self.active_decisions: Dict[str, HiveDecision] = {}
         self.decision_history: List[HiveDecision] = []
+        # Resolved with the decision once voting finishes, see await_decision
+        self._decision_futures: Dict[str, asyncio.Future] = {}
+        self._decision_seq = itertools.count(1)
         
         # Collective intelligence parameters
         self.collective_threshold = 0.75  # Threshold for collective decisions
@@ -231,9 +237,10 @@ class HiveIntelligence:
         self,
         query: str,
         memory_type: Optional[HiveMemoryType] = None,
-        min_confidence: float = 0.5
+        min_confidence: float = 0.5,
+        limit: int = 10
     ) -> List[HiveMemoryFragment]:
-        """Recall relevant memory fragments from collective memory"""
+        """Recall the `limit` most relevant memory fragments from collective memory"""
         
         relevant_fragments = []
         
@@ -254,15 +261,14 @@ class HiveIntelligence:
                 fragment.last_accessed = time.time()
                 relevant_fragments.append(fragment)
         
-        # Sort by relevance and confidence
-        relevant_fragments.sort(
-            key=lambda f: f.confidence_score * f.relevance_decay,
-            reverse=True
-        )
-        
         self.memory_operations.labels(operation="recall").inc()
         
-        return relevant_fragments[:10]  # Return top 10 most relevant
+        # Top fragments by confidence and decay; a bounded heap instead of a full sort
+        return heapq.nlargest(
+            limit,
+            relevant_fragments,
+            key=lambda f: f.confidence_score * f.relevance_decay
+        )
     
     def _calculate_memory_relevance(self, query: str, fragment: HiveMemoryFragment) -> float:
         """Calculate relevance of memory fragment to query"""
@@ -284,17 +290,19 @@ class HiveIntelligence:
     ) -> str:
         """Initiate a collective decision-making process"""
         
-        decision_id = f"hive_decision_{int(time.time())}"
+        # The sequence keeps ids unique when several decisions start within a second
+        decision_id = f"hive_decision_{int(time.time())}_{next(self._decision_seq)}"
         
         decision = HiveDecision(
             decision_id=decision_id,
             question=question,
             options=options,
             method=method,
-            participants=set(node.agent_id for node in self.nodes.values())
+            participants=set(map(attrgetter("agent_id"), self.nodes.values()))
         )
         
         self.active_decisions[decision_id] = decision
+        self._decision_futures[decision_id] = asyncio.get_running_loop().create_future()
         
         self.logger.info(
             "hive_decision_initiated",
@@ -309,6 +317,19 @@ class HiveIntelligence:
         
         return decision_id
     
+    async def await_decision(self, decision_id: str) -> HiveDecision:
+        """Wait until a decision is resolved and return it; wrap in asyncio.wait_for to bound the wait"""
+        
+        future = self._decision_futures.get(decision_id)
+        if future is not None:
+            # Shielded so a timed out waiter does not cancel the future for other waiters
+            return await asyncio.shield(future)
+        
+        for decision in reversed(self.decision_history):
+            if decision.decision_id == decision_id:
+                return decision
+        raise KeyError(f"Unknown hive decision: {decision_id}")
+    
     async def _process_hive_decision(self, decision_id: str, timeout_seconds: int):
         """Process hive decision with timeout"""
         
@@ -442,6 +463,9 @@ class HiveIntelligence:
         # Move to history
         self.decision_history.append(decision)
         del self.active_decisions[decision_id]
+        future = self._decision_futures.pop(decision_id, None)
+        if future is not None and not future.done():
+            future.set_result(decision)
         
         # Update metrics
         outcome = "consensus" if decision.consensus_reached else "no_consensus"
@@ -6,7 +6,8 @@ Integrates swarm intelligence and hive mind functionality with agent management
 import asyncio
 import json
 import time
-from typing import Dict, List, Optional, Any, Union
+from operator import attrgetter
+from typing import Dict, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 import logging
@@ -23,7 +24,7 @@ class CoordinationMode(Enum):
     SWARM_HIVE_HYBRID = "hybrid"        # Combined approach
     ADAPTIVE_SELECTION = "adaptive"     # Auto-select best mode
 
-@dataclass
+@dataclass(slots=True)
 class CoordinationTask:
     task_id: str
     description: str
@@ -33,6 +34,14 @@ class CoordinationTask:
     coordination_mode: Optional[CoordinationMode] = None
     metadata: Dict[str, Any] = None
 
+def _copy_status(value: Any) -> Any:
+    """Copy of a status payload: dicts and lists are copied at every level, scalars are shared"""
+    if isinstance(value, dict):
+        return {key: _copy_status(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_status(item) for item in value]
+    return value
+
 class SwarmHiveCoordinator:
     """
     Master coordinator that integrates swarm intelligence with hive mind capabilities
@@ -62,6 +71,12 @@ class SwarmHiveCoordinator:
         self.hybrid_threshold = 0.7  # Complexity threshold for hybrid mode
         self.adaptive_learning_rate = 0.1
         
+        # Status snapshot reused by get_coordination_status for status_ttl seconds,
+        # dropped early when a coordination starts or finishes
+        self.status_ttl = 0.1
+        self._status_version = 0
+        self._status_cache: Optional[Tuple[int, float, Dict[str, Any]]] = None
+        
         self.logger.info("swarm_hive_coordinator_initialized")
     
     async def coordinate_task(
@@ -71,8 +86,9 @@ class SwarmHiveCoordinator:
     ) -> Dict[str, Any]:
         """Main coordination entry point"""
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         self.active_coordinations[task.task_id] = task
+        self._status_version += 1
         
         try:
             # Determine optimal coordination mode
@@ -94,7 +110,7 @@ class SwarmHiveCoordinator:
                 result = {"error": f"Unknown coordination mode: {coordination_mode}"}
             
             # Record results
-            coordination_time = time.time() - start_time
+            coordination_time = time.perf_counter() - start_time
             self.coordination_efficiency.observe(result.get("efficiency_score", 0.5))
             
             if result.get("status") == "success":
@@ -126,6 +142,7 @@ class SwarmHiveCoordinator:
             # Clean up
             if task.task_id in self.active_coordinations:
                 del self.active_coordinations[task.task_id]
+            self._status_version += 1
     
     async def _select_coordination_mode(self, task: CoordinationTask) -> CoordinationMode:
         """Adaptively select the best coordination mode for the task"""
@@ -251,7 +268,7 @@ class SwarmHiveCoordinator:
                 "complexity": task.complexity
             },
             HiveMemoryType.WORKING,
-            set(node.agent_id for node in hive_nodes),
+            set(map(attrgetter("agent_id"), hive_nodes)),
             confidence=0.8
         )
         
@@ -388,26 +405,21 @@ class SwarmHiveCoordinator:
     async def _wait_for_hive_decision(self, decision_id: str, max_wait_seconds: int) -> Dict[str, Any]:
         """Wait for hive decision to be resolved"""
         
-        wait_time = 0
-        check_interval = 1.0
-        
-        while wait_time < max_wait_seconds:
-            # Check if decision is resolved
-            if decision_id not in self.hive_intelligence.active_decisions:
-                # Decision is resolved, find it in history
-                for decision in self.hive_intelligence.decision_history:
-                    if decision.decision_id == decision_id:
-                        return {
-                            "decision_id": decision_id,
-                            "consensus_reached": decision.consensus_reached,
-                            "confidence": decision.confidence,
-                            "method_used": decision.method.value,
-                            "participants": len(decision.participants)
-                        }
-                break
-            
-            await asyncio.sleep(check_interval)
-            wait_time += check_interval
+        try:
+            decision = await asyncio.wait_for(
+                self.hive_intelligence.await_decision(decision_id),
+                timeout=max_wait_seconds
+            )
+        except (asyncio.TimeoutError, KeyError):
+            pass
+        else:
+            return {
+                "decision_id": decision_id,
+                "consensus_reached": decision.consensus_reached,
+                "confidence": decision.confidence,
+                "method_used": decision.method.value,
+                "participants": len(decision.participants)
+            }
         
         # Decision not resolved in time
         return {
@@ -534,6 +546,8 @@ class SwarmHiveCoordinator:
             confidence=1.0
         )
         
+        self._status_version += 1
+        
         self.logger.info(
             "persistent_swarm_hive_created",
             swarm_hive_id=swarm_hive_id,
@@ -550,7 +564,18 @@ class SwarmHiveCoordinator:
         }
     
     def get_coordination_status(self) -> Dict[str, Any]:
-        """Get current coordination system status"""
+        """Get current coordination system status, cached for status_ttl seconds"""
+        
+        now = time.monotonic()
+        cached = self._status_cache
+        if cached is None or cached[0] != self._status_version or now - cached[1] >= self.status_ttl:
+            cached = self._status_cache = (self._status_version, now, self._build_coordination_status())
+        
+        # Callers get their own copy at every level, so one caller's edits never reach the next
+        return _copy_status(cached[2])
+    
+    def _build_coordination_status(self) -> Dict[str, Any]:
+        """Assemble the coordination status from the swarm manager and hive"""
         
         swarm_status = self.swarm_manager.get_all_swarms_status()
         hive_status = self.hive_intelligence.get_hive_status()
@@ -559,7 +584,7 @@ class SwarmHiveCoordinator:
             "coordinator": {
                 "active_coordinations": len(self.active_coordinations),
                 "coordination_history": len(self.coordination_history),
-                "performance_metrics": self.performance_metrics
+                "performance_metrics": dict(self.performance_metrics)
             },
             "swarm_manager": swarm_status,
             "hive_intelligence": hive_status,
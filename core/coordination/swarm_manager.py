@@ -4,9 +4,11 @@ Implements collective intelligence, hive-mind, and swarm coordination patterns
 """
 
 import asyncio
+import itertools
 import json
+import statistics
 import time
-from typing import Dict, List, Optional, Any, Union, Set
+from typing import Dict, List, Optional, Any, Union, Set, Tuple, Callable, Awaitable, Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 import logging
@@ -14,6 +16,55 @@ from pathlib import Path
 import structlog
 from prometheus_client import Counter, Histogram, Gauge
 
+# NumPy is only needed for very large swarms, so it is imported on first use
+_np: Any = None
+
+def _numpy():
+    """Return the numpy module, or None when it is not installed"""
+    global _np
+    if _np is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _np = numpy
+    return _np or None
+
+def _best_worker_index(
+    required_caps: Sequence[str],
+    capabilities: List[Tuple[str, ...]],
+    trust: List[float],
+    load: List[float]
+) -> int:
+    """Index of the highest scoring worker (capability matches * trust - load), first wins ties"""
+    best_index = 0
+    best_score = 0.0
+    for i in range(len(trust)):
+        caps = capabilities[i]
+        matches = 0
+        for cap in required_caps:
+            if cap in caps:
+                matches += 1
+        score = matches * trust[i] - load[i]
+        if i == 0 or score > best_score:
+            best_index = i
+            best_score = score
+    return best_index
+
+def _weighted_argmax(confidence: List[float], trust: List[float]) -> Tuple[int, float]:
+    """Index of the highest confidence * trust entry, and the total trust"""
+    best_index = 0
+    best_score = 0.0
+    total_trust = 0.0
+    for i in range(len(trust)):
+        t = trust[i]
+        total_trust += t
+        score = confidence[i] * t
+        if i == 0 or score > best_score:
+            best_index = i
+            best_score = score
+    return best_index, total_trust
+
 class SwarmTopology(Enum):
     HIERARCHICAL = "hierarchical"      # Queen-led coordination
     MESH = "mesh"                      # Peer-to-peer coordination  
@@ -27,18 +78,18 @@ class SwarmRole(Enum):
     COORDINATOR = "coordinator"        # Inter-swarm communication
     SPECIALIST = "specialist"          # Domain expertise role
 
-@dataclass
+@dataclass(slots=True)
 class SwarmAgent:
     agent_id: str
     role: SwarmRole
-    capabilities: List[str]
+    capabilities: Tuple[str, ...]  # Interned; shared between agents with identical capability sets
     load_capacity: float = 1.0
     current_load: float = 0.0
     trust_score: float = 0.8
     coordination_history: List[Dict] = field(default_factory=list)
     swarm_memberships: Set[str] = field(default_factory=set)
 
-@dataclass
+@dataclass(slots=True)
 class SwarmState:
     swarm_id: str
     topology: SwarmTopology
@@ -48,6 +99,11 @@ class SwarmState:
     consensus_threshold: float = 0.75
     health_score: float = 1.0
     created_at: float = field(default_factory=time.time)
+    # Bound coordination pattern for the current topology, resolved once at creation
+    coordinate_fn: Optional[Callable[..., Awaitable[Dict[str, Any]]]] = field(default=None, repr=False)
+    # Cached get_swarm_status payload, rebuilt only after a mutation marks it dirty
+    _status_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+    _status_dirty: bool = field(default=True, init=False, repr=False)
 
 class SwarmManager:
     """
@@ -61,11 +117,15 @@ class SwarmManager:
     active_swarms_gauge = Gauge('active_swarms_count', 'Number of active swarms')
     consensus_time = Histogram('consensus_duration_seconds', 'Time to reach swarm consensus')
     
-    def __init__(self, agent_manager=None):
+    def __init__(self, agent_manager=None, simulate: Optional[bool] = None):
         """Initialize swarm management system"""
         self.logger = structlog.get_logger(__name__)
         self.agent_manager = agent_manager
         
+        # Simulated work delays only apply in standalone/test mode; otherwise
+        # placeholder awaits are plain cooperative yields
+        self.simulate = agent_manager is None if simulate is None else simulate
+        
         # Swarm state management
         self.active_swarms: Dict[str, SwarmState] = {}
         self.global_memory: Dict[str, Any] = {}
@@ -79,6 +139,16 @@ class SwarmManager:
             SwarmTopology.ADAPTIVE: self._adaptive_coordination
         }
         
+        # Pre-bound metric children to skip per-call label resolution
+        self._ctr_formations = {t: self.swarm_formations.labels(topology=t.value) for t in SwarmTopology}
+        self._ctr_decisions = {o: self.collective_decisions.labels(outcome=o) for o in ("success", "partial", "failed")}
+        
+        # Keeps task ids unique when a swarm runs several tasks within a second
+        self._task_seq = itertools.count(1)
+        
+        # Interned capability tuples shared by this manager's swarm agents
+        self._cap_pool: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+        
         self.logger.info("swarm_manager_initialized")
     
     async def create_swarm(
@@ -103,10 +173,12 @@ class SwarmManager:
                 # Determine optimal role based on agent capabilities
                 role = self._determine_swarm_role(agent_config, topology)
                 
+                caps_key = tuple(agent_config.capabilities.specialization_domains or ()) if agent_config.capabilities else ()
+                
                 swarm_agent = SwarmAgent(
                     agent_id=agent_id,
                     role=role,
-                    capabilities=agent_config.capabilities.specialization_domains if agent_config.capabilities else []
+                    capabilities=self._cap_pool.setdefault(caps_key, caps_key)
                 )
                 swarm_agents[agent_id] = swarm_agent
         
@@ -118,9 +190,10 @@ class SwarmManager:
             task_queue=[],
             collective_memory={"formation_context": task_context}
         )
+        swarm_state.coordinate_fn = self.coordination_patterns[topology]
         
         self.active_swarms[swarm_id] = swarm_state
-        self.swarm_formations.labels(topology=topology.value).inc()
+        self._ctr_formations[topology].inc()
         self.active_swarms_gauge.set(len(self.active_swarms))
         
         self.logger.info(
@@ -177,15 +250,15 @@ class SwarmManager:
         swarm = self.active_swarms[swarm_id]
         
         # Add task to swarm queue
-        task["task_id"] = f"{swarm_id}_{int(time.time())}"
+        task["task_id"] = f"{swarm_id}_{int(time.time())}_{next(self._task_seq)}"
         swarm.task_queue.append(task)
+        swarm._status_dirty = True
         
         start_time = time.time()
         
         try:
             # Use appropriate coordination pattern
-            coordination_func = self.coordination_patterns[swarm.topology]
-            result = await coordination_func(swarm, task)
+            result = await swarm.coordinate_fn(swarm, task)
             
             # Record coordination time
             coordination_duration = time.time() - start_time
@@ -198,16 +271,17 @@ class SwarmManager:
                 "participants": list(swarm.active_agents.keys()),
                 "timestamp": time.time()
             }
+            swarm._status_dirty = True
             
-            self.collective_decisions.labels(
-                outcome="success" if result.get("status") == "completed" else "partial"
-            ).inc()
+            self._ctr_decisions[
+                "success" if result.get("status") == "completed" else "partial"
+            ].inc()
             
             return result
             
         except Exception as e:
             self.logger.error("swarm_coordination_failed", swarm_id=swarm_id, error=str(e))
-            self.collective_decisions.labels(outcome="failed").inc()
+            self._ctr_decisions["failed"].inc()
             return {"error": f"Swarm coordination failed: {e}"}
     
     async def _hierarchical_coordination(self, swarm: SwarmState, task: Dict[str, Any]) -> Dict[str, Any]:
@@ -241,7 +315,7 @@ class SwarmManager:
             # Find best worker for subtask
             best_worker = self._find_best_worker(worker_agents, subtask)
             if best_worker:
-                result = await self._execute_subtask(best_worker, subtask)
+                result = await self._execute_subtask(swarm, best_worker, subtask)
                 delegation_results.append(result)
         
         # Queen integrates results
@@ -355,17 +429,21 @@ class SwarmManager:
         
         # Temporarily switch to optimal topology
         original_topology = swarm.topology
+        original_coordinate_fn = swarm.coordinate_fn
         swarm.topology = optimal_topology
+        swarm.coordinate_fn = self.coordination_patterns[optimal_topology]
+        swarm._status_dirty = True
         
         try:
             # Execute with optimal topology
-            coordination_func = self.coordination_patterns[optimal_topology]
-            result = await coordination_func(swarm, task)
+            result = await swarm.coordinate_fn(swarm, task)
             result["adaptive_topology_used"] = optimal_topology.value
             return result
         finally:
             # Restore original topology
             swarm.topology = original_topology
+            swarm.coordinate_fn = original_coordinate_fn
+            swarm._status_dirty = True
     
     async def _generate_task_strategy(self, queen_agent: SwarmAgent, task: Dict[str, Any]) -> Dict[str, Any]:
         """Generate strategic approach for task (Queen agent logic)"""
@@ -385,33 +463,23 @@ class SwarmManager:
         if not workers:
             return None
         
-        # Score workers based on capabilities and load
-        scored_workers = []
-        for worker in workers:
-            capability_score = 0
-            required_caps = subtask.get("required_capabilities", [])
-            
-            for cap in required_caps:
-                if cap in worker.capabilities:
-                    capability_score += 1
-            
-            # Factor in current load (prefer less loaded agents)
-            load_penalty = worker.current_load
-            total_score = capability_score * worker.trust_score - load_penalty
-            
-            scored_workers.append((total_score, worker))
-        
-        # Return highest scoring worker
-        scored_workers.sort(key=lambda x: x[0], reverse=True)
-        return scored_workers[0][1] if scored_workers else workers[0]
+        # Score workers based on capabilities and load (prefer less loaded agents)
+        index = _best_worker_index(
+            subtask.get("required_capabilities", []),
+            [worker.capabilities for worker in workers],
+            [worker.trust_score for worker in workers],
+            [worker.current_load for worker in workers]
+        )
+        return workers[index]
     
-    async def _execute_subtask(self, worker: SwarmAgent, subtask: Dict[str, Any]) -> Dict[str, Any]:
+    async def _execute_subtask(self, swarm: SwarmState, worker: SwarmAgent, subtask: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a subtask with a specific worker agent"""
         # Update worker load
         worker.current_load += 0.1
+        swarm._status_dirty = True
         
         # Simulate task execution
-        await asyncio.sleep(0.1)  # Placeholder for actual execution
+        await asyncio.sleep(0.1 if self.simulate else 0)  # Placeholder for actual execution
         
         result = {
             "worker_id": worker.agent_id,
@@ -424,21 +492,33 @@ class SwarmManager:
         # Update worker load
         worker.current_load -= 0.1
         worker.current_load = max(0, worker.current_load)
+        swarm._status_dirty = True
         
         return result
     
     async def _integrate_results(self, queen_agent: SwarmAgent, results: List[Dict], task: Dict[str, Any]) -> Dict[str, Any]:
         """Integrate subtask results (Queen agent logic)"""
+        np = _numpy() if len(results) > 64 else None
+        if np is not None:
+            # Large swarms: contiguous float reduction in NumPy
+            overall_confidence = float(np.fromiter(
+                (r.get("confidence", 0.5) for r in results), dtype=np.float32, count=len(results)
+            ).mean())
+        elif results:
+            overall_confidence = statistics.fmean([r.get("confidence", 0.5) for r in results])
+        else:
+            overall_confidence = 0
+        
         return {
             "integrated_by": queen_agent.agent_id,
             "subtask_count": len(results),
-            "overall_confidence": sum(r.get("confidence", 0.5) for r in results) / len(results) if results else 0,
+            "overall_confidence": overall_confidence,
             "final_output": f"Integrated solution for {task.get('type', 'task')}"
         }
     
     async def _get_agent_proposal(self, agent: SwarmAgent, task: Dict[str, Any]) -> Dict[str, Any]:
         """Get proposal from agent (peer-to-peer)"""
-        await asyncio.sleep(0.05)  # Simulate thinking time
+        await asyncio.sleep(0.05 if self.simulate else 0)  # Simulate thinking time
         return {
             "approach": f"{agent.agent_id} proposes solution using {', '.join(agent.capabilities)}",
             "confidence": agent.trust_score,
@@ -450,11 +530,21 @@ class SwarmManager:
         if not proposals:
             return {"error": "No proposals to build consensus from"}
         
-        # Weight proposals by trust score
-        total_trust = sum(p["trust_score"] for p in proposals)
-        
-        # Simple consensus: highest weighted confidence
-        best_proposal = max(proposals, key=lambda p: p["proposal"]["confidence"] * p["trust_score"])
+        np = _numpy() if len(proposals) >= 32 else None
+        if np is not None:
+            # Large mesh swarms: vectorized trust-weighted scoring
+            count = len(proposals)
+            trust = np.fromiter((p["trust_score"] for p in proposals), dtype=np.float64, count=count)
+            conf = np.fromiter((p["proposal"]["confidence"] for p in proposals), dtype=np.float64, count=count)
+            best_proposal = proposals[int((conf * trust).argmax())]
+            total_trust = float(trust.sum())
+        else:
+            # Single pass: total trust weight and highest weighted confidence
+            index, total_trust = _weighted_argmax(
+                [p["proposal"]["confidence"] for p in proposals],
+                [p["trust_score"] for p in proposals]
+            )
+            best_proposal = proposals[index]
         
         consensus_score = (best_proposal["trust_score"] / total_trust) if total_trust > 0 else 0
         
@@ -466,7 +556,7 @@ class SwarmManager:
     
     async def _analyze_task_aspect(self, agent: SwarmAgent, task: Dict[str, Any], aspect: str) -> Dict[str, Any]:
         """Analyze specific aspect of task for collective intelligence"""
-        await asyncio.sleep(0.02)  # Simulate analysis time
+        await asyncio.sleep(0.02 if self.simulate else 0)  # Simulate analysis time
         return {
             "agent_id": agent.agent_id,
             "aspect": aspect,
@@ -502,7 +592,7 @@ class SwarmManager:
     
     async def _execute_collective_task(self, agent: SwarmAgent, collective_task: Dict[str, Any]) -> Dict[str, Any]:
         """Execute task with collective consciousness"""
-        await asyncio.sleep(0.1)  # Simulate execution
+        await asyncio.sleep(0.1 if self.simulate else 0)  # Simulate execution
         return {
             "agent_id": agent.agent_id,
             "contribution": f"Collective contribution from {agent.agent_id}",
@@ -560,33 +650,43 @@ class SwarmManager:
         
         swarm = self.active_swarms[swarm_id]
         
-        return {
-            "swarm_id": swarm_id,
-            "topology": swarm.topology.value,
-            "agent_count": len(swarm.active_agents),
-            "active_agents": [
-                {
-                    "agent_id": agent.agent_id,
-                    "role": agent.role.value,
-                    "load": agent.current_load,
-                    "trust_score": agent.trust_score
-                }
-                for agent in swarm.active_agents.values()
-            ],
-            "task_queue_size": len(swarm.task_queue),
-            "health_score": swarm.health_score,
-            "uptime": time.time() - swarm.created_at,
-            "memory_size": len(swarm.collective_memory)
-        }
+        if swarm._status_dirty or swarm._status_cache is None:
+            swarm._status_cache = {
+                "swarm_id": swarm_id,
+                "topology": swarm.topology.value,
+                "agent_count": len(swarm.active_agents),
+                "active_agents": [
+                    {
+                        "agent_id": agent.agent_id,
+                        "role": agent.role.value,
+                        "load": agent.current_load,
+                        "trust_score": agent.trust_score
+                    }
+                    for agent in swarm.active_agents.values()
+                ],
+                "task_queue_size": len(swarm.task_queue),
+                "health_score": swarm.health_score,
+                "uptime": 0.0,  # Filled in per call below
+                "memory_size": len(swarm.collective_memory)
+            }
+            swarm._status_dirty = False
+        
+        # Callers get their own copy, per-agent entries included; uptime is always current
+        status = dict(swarm._status_cache)
+        status["active_agents"] = [dict(agent) for agent in status["active_agents"]]
+        status["uptime"] = time.time() - swarm.created_at
+        return status
+    
+    def iter_swarms_status(self):
+        """Lazily yield (swarm_id, status) pairs for all active swarms"""
+        return ((swarm_id, self.get_swarm_status(swarm_id)) for swarm_id in self.active_swarms)
     
-    def get_all_swarms_status(self) -> Dict[str, Any]:
-        """Get status of all active swarms"""
+    def get_all_swarms_status(self, lazy: bool = False) -> Dict[str, Any]:
+        """Get status of all active swarms; with lazy=True "swarms" is an iterator of (swarm_id, status) pairs"""
+        swarms = self.iter_swarms_status()
         return {
             "active_swarms": len(self.active_swarms),
-            "swarms": {
-                swarm_id: self.get_swarm_status(swarm_id)
-                for swarm_id in self.active_swarms.keys()
-            },
+            "swarms": swarms if lazy else dict(swarms),
             "historical_swarms": len(self.swarm_history),
             "global_memory_size": len(self.global_memory)
         }
@@ -4,16 +4,296 @@ Connects Python agent management with Rust daemon for swarm/hive coordination
 """
 
 import asyncio
+import functools
+import itertools
 import json
 import socket
+import struct
+import sys
 import time
 import logging
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 import structlog
 
-from .agents.agent_manager import AgentManager
-from .coordination.swarm_hive_coordinator import SwarmHiveCoordinator, CoordinationTask, CoordinationMode
+try:
+    import orjson
+except ImportError:  # stdlib fallback keeps the bridge portable
+    orjson = None
+
+from .coordination.swarm_manager import SwarmTopology
+from .coordination.hive_intelligence import HiveDecisionMethod, HiveMemoryType
+from .bridge_params import (
+    ACTION_PARAMS, InvalidParams, decode_params,
+    SwarmCreateParams, SwarmExecuteParams, SwarmStatusParams, SwarmDissolveParams, SwarmListParams,
+    HiveInitParams, HiveDecideParams, HiveRememberParams, HiveRecallParams, HiveStatusParams,
+    CollaborateParams, AgentListParams, AgentInfoParams, TaskStatusParams
+)
+
+# CLI string -> enum lookups
+_TOPOLOGY_MAP = {
+    "hierarchical": SwarmTopology.HIERARCHICAL,
+    "mesh": SwarmTopology.MESH,
+    "collective": SwarmTopology.COLLECTIVE,
+    "adaptive": SwarmTopology.ADAPTIVE
+}
+
+_METHOD_MAP = {
+    "consensus": HiveDecisionMethod.CONSENSUS,
+    "weighted": HiveDecisionMethod.WEIGHTED_VOTING,
+    "quorum": HiveDecisionMethod.QUORUM,
+    "emergent": HiveDecisionMethod.EMERGENT
+}
+
+_MEMTYPE_MAP = {
+    "working": HiveMemoryType.WORKING,
+    "episodic": HiveMemoryType.EPISODIC,
+    "semantic": HiveMemoryType.SEMANTIC,
+    "collective": HiveMemoryType.COLLECTIVE
+}
+
+# Wire format: <uint32 big-endian length><JSON payload>
+_FRAME_HEADER = struct.Struct(">I")
+_FRAME_HEADER_SIZE = _FRAME_HEADER.size
+_MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+
+if orjson is not None:
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+else:
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(bytes(data))
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+def _preview(content: Any, limit: int) -> str:
+    """Truncated string form of memory content, stringified at most once"""
+    text = content if isinstance(content, str) else str(content)
+    return f"{text[:limit]}..." if len(text) > limit else text
+
+# Queue markers for the per-connection command worker
+_INVALID_COMMAND = object()
+_END_OF_STREAM = object()
+
+# Read-only actions that may run concurrently within one connection
+_CONCURRENT_ACTIONS = frozenset(map(sys.intern, (
+    "swarm_status", "swarm_list", "hive_recall", "hive_status",
+    "agent_list", "agent_info", "task_status",
+)))
+
+def _encode_response(logger, action: Any, result: Any) -> bytes:
+    """Serialize a command result, or an error reply when the result is not JSON-encodable"""
+    try:
+        return _json_dumps(result)
+    except (TypeError, ValueError) as e:  # orjson.JSONEncodeError is a TypeError
+        logger.error("response_encoding_error", action=action, error=str(e))
+        return _json_dumps({"error": f"Response could not be encoded: {e}"})
+
+# Constant reply to malformed frames, serialized once
+_INVALID_COMMAND_BODY = _json_dumps({"error": "Invalid JSON command"})
+
+
+class BridgeProtocol(asyncio.BufferedProtocol):
+    """
+    Length-prefixed command protocol for one Rust daemon connection.
+    The transport receives directly into a protocol-owned buffer and frames
+    are decoded in place. Read-only commands of a pipelined batch run
+    concurrently, any other command waits for everything before it and
+    blocks what follows; responses are always written in arrival order.
+    """
+    
+    initial_buffer_size = 65536
+    max_pending_commands = 64
+    max_concurrent_commands = 32
+    
+    def __init__(self, bridge: "DaemonBridge"):
+        self.bridge = bridge
+        self.transport: Optional[asyncio.Transport] = None
+        self._buf = bytearray(self.initial_buffer_size)
+        self._read_pos = 0
+        self._write_pos = 0
+        self._commands: asyncio.Queue = asyncio.Queue()
+        self._responses: asyncio.Queue = asyncio.Queue()
+        self._in_flight: set = set()
+        self._slots = asyncio.Semaphore(self.max_concurrent_commands)
+        self._worker: Optional[asyncio.Task] = None
+        self._writer: Optional[asyncio.Task] = None
+        self._can_write = asyncio.Event()
+        self._can_write.set()
+        self._reading_paused = False
+        self._pending_out: List[bytes] = []
+        self._flush_scheduled = False
+    
+    def connection_made(self, transport):
+        self.transport = transport
+        transport.set_write_buffer_limits(high=256 * 1024)
+        loop = asyncio.get_running_loop()
+        self._worker = loop.create_task(self._run_commands())
+        self._writer = loop.create_task(self._write_responses())
+    
+    def connection_lost(self, exc):
+        self.transport = None
+        self._can_write.set()
+        for task in (self._worker, self._writer, *self._in_flight):
+            if task is not None:
+                task.cancel()
+    
+    def eof_received(self):
+        # Keep the transport open until queued commands have been answered
+        self._commands.put_nowait(_END_OF_STREAM)
+        return True
+    
+    def pause_writing(self):
+        self._can_write.clear()
+    
+    def resume_writing(self):
+        self._can_write.set()
+    
+    def _queue_response(self, body: bytes):
+        """Coalesce response frames produced in the same loop iteration into one write"""
+        self._pending_out.append(_FRAME_HEADER.pack(len(body)))
+        self._pending_out.append(body)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self._flush)
+    
+    def _flush(self):
+        self._flush_scheduled = False
+        if self.transport is not None and self._pending_out:
+            self.transport.writelines(self._pending_out)
+        self._pending_out.clear()
+    
+    def get_buffer(self, sizehint: int):
+        if self._read_pos == self._write_pos:
+            self._read_pos = self._write_pos = 0
+        elif self._read_pos >= len(self._buf) // 2:
+            # Compact: move the unparsed tail to the front (same-size assignment)
+            pending = self._write_pos - self._read_pos
+            self._buf[:pending] = self._buf[self._read_pos:self._write_pos]
+            self._read_pos, self._write_pos = 0, pending
+        
+        if self._write_pos == len(self._buf):
+            # Full buffer holding a partial frame: grow into a fresh allocation
+            grown = bytearray(len(self._buf) * 2)
+            pending = self._write_pos - self._read_pos
+            grown[:pending] = self._buf[self._read_pos:self._write_pos]
+            self._buf = grown
+            self._read_pos, self._write_pos = 0, pending
+        
+        return memoryview(self._buf)[self._write_pos:]
+    
+    def buffer_updated(self, nbytes: int):
+        self._write_pos += nbytes
+        buf = self._buf
+        
+        while self._write_pos - self._read_pos >= _FRAME_HEADER_SIZE:
+            start = self._read_pos + _FRAME_HEADER_SIZE
+            (length,) = _FRAME_HEADER.unpack_from(buf, self._read_pos)
+            if length > _MAX_FRAME_SIZE:
+                self.bridge.logger.warning("frame_too_large", length=length)
+                self.transport.close()
+                return
+            end = start + length
+            if end > self._write_pos:
+                break
+            
+            with memoryview(buf)[start:end] as payload:
+                try:
+                    command = _json_loads(payload)
+                except ValueError:  # Malformed JSON, or non-UTF-8 bytes on the stdlib path
+                    command = _INVALID_COMMAND
+                else:
+                    if not isinstance(command, dict):
+                        command = _INVALID_COMMAND
+            self._read_pos = end
+            self._commands.put_nowait(command)
+        
+        if self._commands.qsize() >= self.max_pending_commands and not self._reading_paused:
+            self.transport.pause_reading()
+            self._reading_paused = True
+    
+    async def _execute(self, command: Dict[str, Any]) -> bytes:
+        try:
+            result = await self.bridge.process_command(command)
+        finally:
+            self._slots.release()
+        return _encode_response(self.bridge.logger, command.get("action"), result)
+    
+    async def _run_commands(self):
+        """Start queued commands in arrival order and hand their tasks to the writer"""
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                command = await self._commands.get()
+                if self._reading_paused and self._commands.qsize() < self.max_pending_commands // 2:
+                    self.transport.resume_reading()
+                    self._reading_paused = False
+                
+                if command is _END_OF_STREAM:
+                    break
+                if command is _INVALID_COMMAND:
+                    done = loop.create_future()
+                    done.set_result(_INVALID_COMMAND_BODY)
+                    self._responses.put_nowait(done)
+                    continue
+                
+                action = command.get("action")
+                if type(action) is str:
+                    # Canonical copy: the set and dispatch lookups below then match by identity
+                    command["action"] = action = sys.intern(action)
+                concurrent = action in _CONCURRENT_ACTIONS
+                if not concurrent and self._in_flight:
+                    # Barrier: a mutating command sees every earlier command's effects
+                    await asyncio.wait(self._in_flight)
+                
+                await self._slots.acquire()
+                task = loop.create_task(self._execute(command))
+                self._responses.put_nowait(task)
+                if concurrent:
+                    self._in_flight.add(task)
+                    task.add_done_callback(self._in_flight.discard)
+                else:
+                    await asyncio.wait((task,))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.bridge.logger.error("client_handler_error", error=str(e))
+        
+        self._responses.put_nowait(_END_OF_STREAM)
+    
+    async def _write_responses(self):
+        """Write framed responses in command order as their tasks complete"""
+        try:
+            while True:
+                pending = await self._responses.get()
+                if pending is _END_OF_STREAM:
+                    break
+                try:
+                    body = await pending
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    # One failed command gets an error frame; the connection stays up
+                    self.bridge.logger.error("command_processing_error", error=str(e))
+                    body = _json_dumps({"error": f"Command processing failed: {e}"})
+                
+                await self._can_write.wait()
+                if self.transport is None:
+                    return
+                self._queue_response(body)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.bridge.logger.error("client_handler_error", error=str(e))
+        
+        if self.transport is not None:
+            self._flush()
+            self.transport.close()
 
 class DaemonBridge:
     """
@@ -24,17 +304,67 @@ class DaemonBridge:
         self.logger = structlog.get_logger(__name__)
         self.socket_path = socket_path
         
-        # Initialize core components
-        self.coordinator = SwarmHiveCoordinator()
-        self.agent_manager = AgentManager(swarm_hive_coordinator=self.coordinator)
+        # Core components (coordinator, agent_manager) are built on first use
         
         # Active operations
         self.active_swarms: Dict[str, Any] = {}
         self.active_hive_operations: Dict[str, Any] = {}
         self.running = False
         
+        # Long-running operations submitted with "background": true
+        self.background_tasks: Dict[str, Dict[str, Any]] = {}
+        self._background_handles: Dict[str, asyncio.Task] = {}
+        self._task_counter = itertools.count(1)
+        
+        # Generated swarm/collaboration ids: bridge start time plus a counter,
+        # unique even for several requests within the same second
+        self._id_counter = itertools.count(1)
+        self._id_epoch = int(time.time())
+        
+        # Per-agent listing/info payloads, rebuilt when the registry generation moves
+        self._agent_info_cache: Dict[str, Dict[str, Any]] = {}
+        self._agent_info_generation = -1
+        
+        # Action dispatch table: action -> (handler, params schema)
+        handlers = {
+            "swarm_create": self.handle_swarm_create,
+            "swarm_execute": self.handle_swarm_execute,
+            "swarm_status": self.handle_swarm_status,
+            "swarm_dissolve": self.handle_swarm_dissolve,
+            "swarm_list": self.handle_swarm_list,
+            
+            "hive_init": self.handle_hive_init,
+            "hive_decide": self.handle_hive_decide,
+            "hive_remember": self.handle_hive_remember,
+            "hive_recall": self.handle_hive_recall,
+            "hive_status": self.handle_hive_status,
+            
+            "collaborate": self.handle_collaborate,
+            "agent_list": self.handle_agent_list,
+            "agent_info": self.handle_agent_info,
+            "task_status": self.handle_task_status,
+        }
+        self._dispatch = {
+            sys.intern(action): (handler, ACTION_PARAMS[action]) for action, handler in handlers.items()
+        }
+        
         self.logger.info("daemon_bridge_initialized", socket_path=socket_path)
     
+    @functools.cached_property
+    def coordinator(self):
+        """Swarm-hive coordinator, created by the first command that needs it"""
+        # Imported here: the coordinator module pulls in the agent registry stack
+        from .coordination.swarm_hive_coordinator import SwarmHiveCoordinator
+        
+        return SwarmHiveCoordinator()
+    
+    @functools.cached_property
+    def agent_manager(self):
+        """Agent registry, created (and its configuration loaded) on first use"""
+        from .agents.agent_manager import AgentManager
+        
+        return AgentManager(swarm_hive_coordinator=self.coordinator)
+    
     async def start(self):
         """Start the daemon bridge"""
         self.running = True
@@ -48,8 +378,9 @@ class DaemonBridge:
             Path(self.socket_path).unlink()
         
         # Start Unix socket server
-        server = await asyncio.start_unix_server(
-            self.handle_client,
+        loop = asyncio.get_running_loop()
+        server = await loop.create_unix_server(
+            lambda: BridgeProtocol(self),
             path=self.socket_path
         )
         
@@ -58,98 +389,48 @@ class DaemonBridge:
         async with server:
             await server.serve_forever()
     
-    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
-        """Handle client connections from Rust daemon"""
-        try:
-            while not reader.at_eof():
-                # Read command from client
-                data = await reader.readline()
-                if not data:
-                    break
-                
-                try:
-                    command = json.loads(data.decode().strip())
-                    response = await self.process_command(command)
-                    
-                    # Send response back
-                    response_data = json.dumps(response) + "\n"
-                    writer.write(response_data.encode())
-                    await writer.drain()
-                    
-                except json.JSONDecodeError:
-                    error_response = {"error": "Invalid JSON command"}
-                    writer.write(json.dumps(error_response).encode() + b"\n")
-                    await writer.drain()
-                    
-        except Exception as e:
-            self.logger.error("client_handler_error", error=str(e))
-        finally:
-            writer.close()
-            await writer.wait_closed()
-    
     async def process_command(self, command: Dict[str, Any]) -> Dict[str, Any]:
         """Process commands from the Rust daemon"""
         
         action = command.get("action")
         params = command.get("params", {})
         
-        self.logger.info("processing_command", action=action, params=params)
+        # Per-RPC trace stays at DEBUG (a no-op under the INFO filtering logger)
+        # and records only the parameter count instead of rendering the payload
+        self.logger.debug(
+            "processing_command",
+            action=action,
+            params_count=len(params) if isinstance(params, dict) else 0
+        )
+        
+        entry = self._dispatch.get(action) if isinstance(action, str) else None
+        if entry is None:
+            return {"error": f"Unknown action: {action}"}
+        handler, schema = entry
         
         try:
-            if action == "swarm_create":
-                return await self.handle_swarm_create(params)
-            elif action == "swarm_execute":
-                return await self.handle_swarm_execute(params)
-            elif action == "swarm_status":
-                return await self.handle_swarm_status(params)
-            elif action == "swarm_dissolve":
-                return await self.handle_swarm_dissolve(params)
-            elif action == "swarm_list":
-                return await self.handle_swarm_list(params)
-                
-            elif action == "hive_init":
-                return await self.handle_hive_init(params)
-            elif action == "hive_decide":
-                return await self.handle_hive_decide(params)
-            elif action == "hive_remember":
-                return await self.handle_hive_remember(params)
-            elif action == "hive_recall":
-                return await self.handle_hive_recall(params)
-            elif action == "hive_status":
-                return await self.handle_hive_status(params)
-                
-            elif action == "collaborate":
-                return await self.handle_collaborate(params)
-            elif action == "agent_list":
-                return await self.handle_agent_list(params)
-            elif action == "agent_info":
-                return await self.handle_agent_info(params)
-                
-            else:
-                return {"error": f"Unknown action: {action}"}
-                
+            params = decode_params(schema, params)
+        except InvalidParams as e:
+            return {"error": f"Invalid params for {action}: {e}"}
+        
+        try:
+            return await handler(params)
         except Exception as e:
             self.logger.error("command_processing_error", action=action, error=str(e))
             return {"error": f"Command processing failed: {str(e)}"}
     
     # Swarm coordination handlers
-    async def handle_swarm_create(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle_swarm_create(self, params: SwarmCreateParams) -> Dict[str, Any]:
         """Handle swarm creation"""
-        swarm_id = params.get("id", f"swarm_{int(time.time())}")
-        topology = params.get("topology", "adaptive")
-        agents = params.get("agents", [])
-        task_description = params.get("task", "")
+        swarm_id = params.id
+        if swarm_id is None:
+            swarm_id = f"swarm_{self._id_epoch}_{next(self._id_counter)}"
+        topology = params.topology
+        agents = params.agents
+        task_description = params.task
         
         # Map string topology to enum
-        from .coordination.swarm_manager import SwarmTopology
-        topology_map = {
-            "hierarchical": SwarmTopology.HIERARCHICAL,
-            "mesh": SwarmTopology.MESH,
-            "collective": SwarmTopology.COLLECTIVE,
-            "adaptive": SwarmTopology.ADAPTIVE
-        }
-        
-        swarm_topology = topology_map.get(topology, SwarmTopology.ADAPTIVE)
+        swarm_topology = _TOPOLOGY_MAP.get(topology, SwarmTopology.ADAPTIVE)
         
         # Create swarm
         swarm = await self.coordinator.swarm_manager.create_swarm(
@@ -169,16 +450,24 @@ class DaemonBridge:
             "status": "created"
         }
     
-    async def handle_swarm_execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle_swarm_execute(self, params: SwarmExecuteParams) -> Dict[str, Any]:
         """Handle swarm task execution"""
-        swarm_id = params.get("swarm_id")
-        task_description = params.get("task", "")
-        timeout = params.get("timeout", 300)
+        swarm_id = params.swarm_id
+        task_description = params.task
+        timeout = params.timeout
         
         if swarm_id not in self.active_swarms:
             return {"error": f"Swarm {swarm_id} not found"}
         
-        # Execute task with swarm
+        if params.background:
+            return self._submit_background_task(
+                "swarm_execute", self._run_swarm_task(swarm_id, task_description), timeout
+            )
+        
+        return await self._run_swarm_task(swarm_id, task_description)
+    
+    async def _run_swarm_task(self, swarm_id: str, task_description: str) -> Dict[str, Any]:
+        """Execute a CLI task with an active swarm"""
         task = {
             "type": "cli_task",
             "description": task_description,
@@ -195,9 +484,9 @@ class DaemonBridge:
             "result": result
         }
     
-    async def handle_swarm_status(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle_swarm_status(self, params: SwarmStatusParams) -> Dict[str, Any]:
         """Handle swarm status request"""
-        swarm_id = params.get("swarm_id")
+        swarm_id = params.swarm_id
         
         if swarm_id not in self.active_swarms:
             return {"error": f"Swarm {swarm_id} not found"}
@@ -212,10 +501,10 @@ class DaemonBridge:
         else:
             return {"error": f"Failed to get status for swarm {swarm_id}"}
     
-    async def handle_swarm_dissolve(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle_swarm_dissolve(self, params: SwarmDissolveParams) -> Dict[str, Any]:
         """Handle swarm dissolution"""
-        swarm_id = params.get("swarm_id")
-        save_results = params.get("save_results", False)
+        swarm_id = params.swarm_id
+        save_results = params.save_results
         
         if swarm_id not in self.active_swarms:
             return {"error": f"Swarm {swarm_id} not found"}
@@ -232,25 +521,21 @@ class DaemonBridge:
         else:
             return {"error": f"Failed to dissolve swarm {swarm_id}"}
     
-    async def handle_swarm_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle_swarm_list(self, params: SwarmListParams) -> Dict[str, Any]:
         """Handle swarm list request"""
-        detailed = params.get("detailed", False)
-        
-        swarms = []
-        for swarm_id, swarm in self.active_swarms.items():
-            swarm_info = {
-                "id": swarm_id,
-                "topology": swarm.topology.value,
-                "agents": len(swarm.active_agents),
-                "status": "active"
-            }
-            
-            if detailed:
-                status = self.coordinator.swarm_manager.get_swarm_status(swarm_id)
+        detailed = params.detailed
+        
+        # Topology and agent count are read live; adaptive swarms and agent churn change both
+        swarms = [
+            {"id": swarm_id, "topology": swarm.topology.value, "agents": len(swarm.active_agents), "status": "active"}
+            for swarm_id, swarm in self.active_swarms.items()
+        ]
+        
+        if detailed:
+            for swarm_info in swarms:
+                status = self.coordinator.swarm_manager.get_swarm_status(swarm_info["id"])
                 if status:
                     swarm_info.update(status)
-            
-            swarms.append(swarm_info)
         
         return {
             "success": True,
@@ -259,27 +544,29 @@ class DaemonBridge:
         }
     
     # Hive intelligence handlers
-    async def handle_hive_init(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle_hive_init(self, params: HiveInitParams) -> Dict[str, Any]:
         """Handle hive node initialization"""
-        agents = params.get("agents", [])
-        capabilities = params.get("capabilities", [])
-        
-        nodes_created = []
+        agents = params.agents
+        capabilities = params.capabilities
         
+        # Resolve each agent's capabilities from the registry up front
+        registry = self.agent_manager.agent_registry
+        prepared = []
         for agent_id in agents:
-            # Get agent capabilities from registry
-            if agent_id in self.agent_manager.agent_registry:
-                agent_config = self.agent_manager.agent_registry[agent_id]
-                agent_capabilities = agent_config.capabilities.specialization_domains if agent_config.capabilities else capabilities
+            agent_config = registry.get(agent_id)
+            if agent_config is not None and agent_config.capabilities:
+                prepared.append((agent_id, agent_config.capabilities.specialization_domains))
             else:
-                agent_capabilities = capabilities
-            
-            # Create hive node
-            node = await self.coordinator.hive_intelligence.initialize_hive_node(
-                agent_id, 
-                agent_capabilities
-            )
-            nodes_created.append(node.node_id)
+                prepared.append((agent_id, capabilities))
+        
+        # Create hive nodes concurrently; results keep the request order
+        hive = self.coordinator.hive_intelligence
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(hive.initialize_hive_node(agent_id, agent_capabilities))
+                for agent_id, agent_capabilities in prepared
+            ]
+        nodes_created = [task.result().node_id for task in tasks]
         
         return {
             "success": True,
@@ -287,12 +574,12 @@ class DaemonBridge:
             "node_ids": nodes_created
         }
     
-    async def handle_hive_decide(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle_hive_decide(self, params: HiveDecideParams) -> Dict[str, Any]:
         """Handle hive collective decision"""
-        question = params.get("question", "")
-        options = params.get("options", [])
-        method = params.get("method", "consensus")
-        timeout = params.get("timeout", 300)
+        question = params.question
+        options = params.options
+        method = params.method
+        timeout = params.timeout
         
         # Convert options to decision format
         decision_options = []
@@ -304,15 +591,7 @@ class DaemonBridge:
             })
         
         # Map method string to enum
-        from .coordination.hive_intelligence import HiveDecisionMethod
-        method_map = {
-            "consensus": HiveDecisionMethod.CONSENSUS,
-            "weighted": HiveDecisionMethod.WEIGHTED_VOTING,
-            "quorum": HiveDecisionMethod.QUORUM,
-            "emergent": HiveDecisionMethod.EMERGENT
-        }
-        
-        decision_method = method_map.get(method, HiveDecisionMethod.CONSENSUS)
+        decision_method = _METHOD_MAP.get(method, HiveDecisionMethod.CONSENSUS)
         
         # Initiate decision
         decision_id = await self.coordinator.hive_intelligence.initiate_hive_decision(
@@ -336,23 +615,15 @@ class DaemonBridge:
             "method": method
         }
     
-    async def handle_hive_remember(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle_hive_remember(self, params: HiveRememberParams) -> Dict[str, Any]:
         """Handle collective memory storage"""
-        content = params.get("content", "")
-        memory_type = params.get("memory_type", "semantic")
-        contributors = params.get("contributors", [])
-        confidence = params.get("confidence", 0.8)
+        content = params.content
+        memory_type = params.memory_type
+        contributors = params.contributors
+        confidence = params.confidence
         
         # Map memory type string to enum
-        from .coordination.hive_intelligence import HiveMemoryType
-        type_map = {
-            "working": HiveMemoryType.WORKING,
-            "episodic": HiveMemoryType.EPISODIC,
-            "semantic": HiveMemoryType.SEMANTIC,
-            "collective": HiveMemoryType.COLLECTIVE
-        }
-        
-        mem_type = type_map.get(memory_type, HiveMemoryType.SEMANTIC)
+        mem_type = _MEMTYPE_MAP.get(memory_type, HiveMemoryType.SEMANTIC)
         
         # Store memory
         memory_id = await self.coordinator.hive_intelligence.store_collective_memory(
@@ -365,42 +636,36 @@ class DaemonBridge:
         return {
             "success": True,
             "memory_id": memory_id,
-            "content_preview": content[:100] + "..." if len(content) > 100 else content,
+            "content_preview": _preview(content, 100),
             "type": memory_type,
             "contributors": len(contributors)
         }
     
-    async def handle_hive_recall(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle_hive_recall(self, params: HiveRecallParams) -> Dict[str, Any]:
         """Handle collective memory recall"""
-        query = params.get("query", "")
-        memory_type = params.get("memory_type")
-        min_confidence = params.get("min_confidence", 0.5)
+        query = params.query
+        memory_type = params.memory_type
+        min_confidence = params.min_confidence
         
         # Map memory type if specified
         mem_type = None
         if memory_type:
-            from .coordination.hive_intelligence import HiveMemoryType
-            type_map = {
-                "working": HiveMemoryType.WORKING,
-                "episodic": HiveMemoryType.EPISODIC,
-                "semantic": HiveMemoryType.SEMANTIC,
-                "collective": HiveMemoryType.COLLECTIVE
-            }
-            mem_type = type_map.get(memory_type)
+            mem_type = _MEMTYPE_MAP.get(memory_type)
         
         # Recall memories
         memories = await self.coordinator.hive_intelligence.recall_collective_memory(
             query,
             mem_type,
-            min_confidence
+            min_confidence,
+            limit=10
         )
         
         # Format results
         results = []
-        for memory in memories[:10]:  # Limit to top 10
+        for memory in memories:
             results.append({
                 "fragment_id": memory.fragment_id,
-                "content_preview": str(memory.content)[:200] + "..." if len(str(memory.content)) > 200 else str(memory.content),
+                "content_preview": _preview(memory.content, 200),
                 "confidence": memory.confidence_score,
                 "type": memory.memory_type.value,
                 "contributors": len(memory.contributors),
@@ -414,11 +679,11 @@ class DaemonBridge:
             "results": results
         }
     
-    async def handle_hive_status(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle_hive_status(self, params: HiveStatusParams) -> Dict[str, Any]:
         """Handle hive status request"""
-        show_nodes = params.get("nodes", False)
-        show_memory = params.get("memory", False)
-        show_decisions = params.get("decisions", False)
+        show_nodes = params.nodes
+        show_memory = params.memory
+        show_decisions = params.decisions
         
         status = self.coordinator.hive_intelligence.get_hive_status()
         
@@ -441,16 +706,27 @@ class DaemonBridge:
         }
     
     # General handlers
-    async def handle_collaborate(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle_collaborate(self, params: CollaborateParams) -> Dict[str, Any]:
         """Handle multi-agent collaboration"""
-        task_description = params.get("task", "")
-        agents = params.get("agents", "").split(",") if params.get("agents") else []
-        mode = params.get("mode", "adaptive_selection")
-        topology = params.get("topology", "adaptive")
+        if params.background:
+            return self._submit_background_task(
+                "collaborate", self._run_collaboration(params), params.timeout
+            )
+        
+        return await self._run_collaboration(params)
+    
+    async def _run_collaboration(self, params: CollaborateParams) -> Dict[str, Any]:
+        """Run a multi-agent collaboration to completion"""
+        from .coordination.swarm_hive_coordinator import CoordinationTask, CoordinationMode
+        
+        task_description = params.task
+        agents = params.agents.split(",") if params.agents else []
+        mode = params.mode
+        topology = params.topology
         
         # Create coordination task
         coordination_task = CoordinationTask(
-            task_id=f"cli_collaborate_{int(time.time())}",
+            task_id=f"cli_collaborate_{self._id_epoch}_{next(self._id_counter)}",
             description=task_description,
             complexity=0.7,  # Default complexity
             required_capabilities=agents if agents else ["development", "coordination"],
@@ -470,11 +746,11 @@ class DaemonBridge:
             "result": result.get("result", {})
         }
     
-    async def handle_agent_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle_agent_list(self, params: AgentListParams) -> Dict[str, Any]:
         """Handle agent list request"""
-        category = params.get("category")
-        available = params.get("available", True)
-        active = params.get("active", False)
+        category = params.category
+        available = params.available
+        active = params.active
         
         agents = []
         
@@ -489,21 +765,11 @@ class DaemonBridge:
                     "status": "active"
                 })
         else:
-            # List available agents
-            registry = self.agent_manager.get_agent_registry()
-            for agent_id, config in registry.items():
-                # Filter by category if specified
-                if category and config.capabilities:
-                    if category not in config.capabilities.specialization_domains:
-                        continue
-                
-                agents.append({
-                    "id": agent_id,
-                    "name": config.name,
-                    "tier": config.tier.value,
-                    "capabilities": config.capabilities.specialization_domains if config.capabilities else [],
-                    "status": "available"
-                })
+            # List available agents, through the category index when filtering
+            registry = self.agent_manager.agent_registry
+            agent_ids = self.agent_manager.get_agents_by_category(category) if category else registry
+            for agent_id in agent_ids:
+                agents.append(self._cached_agent_info(agent_id, registry[agent_id])["list"])
         
         return {
             "success": True,
@@ -512,37 +778,26 @@ class DaemonBridge:
             "filtered_by": category
         }
     
-    async def handle_agent_info(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle_agent_info(self, params: AgentInfoParams) -> Dict[str, Any]:
         """Handle agent info request"""
-        agent_id = params.get("agent")
-        show_capabilities = params.get("capabilities", False)
-        show_status = params.get("status", False)
+        agent_id = params.agent
+        show_capabilities = params.capabilities
+        show_status = params.status
         
         if agent_id not in self.agent_manager.agent_registry:
             return {"error": f"Agent {agent_id} not found"}
         
-        config = self.agent_manager.agent_registry[agent_id]
+        cached = self._cached_agent_info(agent_id, self.agent_manager.agent_registry[agent_id])
         
-        info = {
-            "id": agent_id,
-            "name": config.name,
-            "tier": config.tier.value,
-            "model": config.model,
-            "coordination_priority": config.coordination_priority
-        }
+        # Cached payloads are shared, so extend a copy
+        info = cached["info"]
         
-        if show_capabilities and config.capabilities:
-            info["capabilities"] = {
-                "name": config.capabilities.name,
-                "description": config.capabilities.description,
-                "tools": config.capabilities.tools,
-                "domains": config.capabilities.specialization_domains,
-                "patterns": config.capabilities.coordination_patterns,
-                "triggers": config.capabilities.activation_triggers
-            }
+        if show_capabilities and cached["capabilities"] is not None:
+            info = {**info, "capabilities": cached["capabilities"]}
         
         if show_status:
             is_active = agent_id in self.agent_manager.active_agents
+            info = {**info}
             info["status"] = {
                 "active": is_active,
                 "last_used": "recently" if is_active else "not active"
@@ -553,10 +808,119 @@ class DaemonBridge:
             "agent": info
         }
     
+    def _cached_agent_info(self, agent_id: str, config) -> Dict[str, Any]:
+        """Listing, info and capability payloads for a registry entry, built once per registry generation"""
+        generation = self.agent_manager.registry_generation
+        if generation != self._agent_info_generation:
+            self._agent_info_cache.clear()
+            self._agent_info_generation = generation
+        
+        cached = self._agent_info_cache.get(agent_id)
+        if cached is not None:
+            return cached
+        
+        capabilities = config.capabilities
+        tier = config.tier.value
+        cached = {
+            "list": {
+                "id": agent_id,
+                "name": config.name,
+                "tier": tier,
+                "capabilities": capabilities.specialization_domains if capabilities else [],
+                "status": "available"
+            },
+            "info": {
+                "id": agent_id,
+                "name": config.name,
+                "tier": tier,
+                "model": config.model,
+                "coordination_priority": config.coordination_priority
+            },
+            "capabilities": {
+                "name": capabilities.name,
+                "description": capabilities.description,
+                "tools": capabilities.tools,
+                "domains": capabilities.specialization_domains,
+                "patterns": capabilities.coordination_patterns,
+                "triggers": capabilities.activation_triggers
+            } if capabilities else None
+        }
+        self._agent_info_cache[agent_id] = cached
+        return cached
+    
+    # Background task handlers
+    def _submit_background_task(self, kind: str, operation, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Schedule a long-running operation and return its task id immediately"""
+        task_id = f"{kind}_{next(self._task_counter)}"
+        record = {
+            "task_id": task_id,
+            "kind": kind,
+            "status": "queued",
+            "submitted_at": time.time()
+        }
+        self.background_tasks[task_id] = record
+        self._prune_background_tasks()
+        
+        self._background_handles[task_id] = asyncio.get_running_loop().create_task(
+            self._run_background_task(record, operation, timeout)
+        )
+        
+        return {
+            "success": True,
+            "task_id": task_id,
+            "status": "queued"
+        }
+    
+    async def _run_background_task(self, record: Dict[str, Any], operation, timeout: Optional[float]):
+        """Run a submitted operation and record its outcome"""
+        record["status"] = "running"
+        try:
+            if timeout:
+                record["result"] = await asyncio.wait_for(operation, timeout)
+            else:
+                record["result"] = await operation
+            record["status"] = "completed"
+        except asyncio.TimeoutError:
+            record["status"] = "timeout"
+        except asyncio.CancelledError:
+            record["status"] = "cancelled"
+            raise
+        except Exception as e:
+            record["status"] = "failed"
+            record["error"] = str(e)
+            self.logger.error("background_task_failed", task_id=record["task_id"], error=str(e))
+        finally:
+            record["finished_at"] = time.time()
+            self._background_handles.pop(record["task_id"], None)
+    
+    def _prune_background_tasks(self, max_records: int = 1000):
+        """Drop the oldest finished task records beyond the retention limit"""
+        excess = len(self.background_tasks) - max_records
+        if excess <= 0:
+            return
+        for task_id in [tid for tid, rec in self.background_tasks.items() if "finished_at" in rec][:excess]:
+            del self.background_tasks[task_id]
+    
+    async def handle_task_status(self, params: TaskStatusParams) -> Dict[str, Any]:
+        """Handle background task status request"""
+        task_id = params.task_id
+        
+        if task_id not in self.background_tasks:
+            return {"error": f"Task {task_id} not found"}
+        
+        return {
+            "success": True,
+            "task": self.background_tasks[task_id]
+        }
+    
     async def stop(self):
         """Stop the daemon bridge"""
         self.running = False
         
+        # Cancel outstanding background work
+        for handle in list(self._background_handles.values()):
+            handle.cancel()
+        
         # Clean up active swarms
         for swarm_id in list(self.active_swarms.keys()):
             await self.coordinator.swarm_manager.dissolve_swarm(swarm_id)
@@ -586,4 +950,11 @@ if __name__ == "__main__":
         cache_logger_on_first_use=True,
     )
     
+    # Prefer uvloop's libuv-based event loop for the socket server when available
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(main())
\ No newline at end of file
@@ -4,29 +4,120 @@ Provides comprehensive health monitoring for agent operations
 """
 
 import asyncio
+import functools
 import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
 import time
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from collections import Counter as TallyCounter, deque
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, field, replace
 from enum import Enum
 import psutil
 from prometheus_client import Gauge, Counter, Histogram
 import structlog
 
+try:
+    import orjson
+except ImportError:  # stdlib fallback
+    orjson = None
+
 class HealthStatus(Enum):
     HEALTHY = "healthy"
     DEGRADED = "degraded"
     UNHEALTHY = "unhealthy"
     CRITICAL = "critical"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HealthCheck:
     name: str
     status: HealthStatus
     message: str
     timestamp: float
     duration_ms: float
-    metadata: Dict[str, Any] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+def to_json_bytes(report: Dict[str, Any]) -> bytes:
+    """Serialize a health report for an HTTP response body (application/json)"""
+    if orjson is not None:
+        return orjson.dumps(report, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(report).encode()
+
+def _copy_report(value: Any) -> Any:
+    """Copy of a health report: dicts and lists are copied at every level, scalars are shared"""
+    if isinstance(value, dict):
+        return {key: _copy_report(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_report(item) for item in value]
+    return value
+
+class _QueuedLineLogger:
+    """
+    structlog logger that hands rendered lines to a log writer thread instead of
+    writing them on the event loop; when the queue is full the line is dropped and counted
+    """
+    
+    def __init__(self, log_queue: queue.Queue, dropped_metric):
+        self._queue = log_queue
+        self._dropped_metric = dropped_metric
+        self.dropped = 0
+    
+    def msg(self, message: str) -> None:
+        try:
+            self._queue.put_nowait(logging.makeLogRecord({"msg": message}))
+        except queue.Full:
+            self.dropped += 1
+            self._dropped_metric.inc()
+    
+    log = debug = info = warn = warning = err = error = critical = exception = fatal = failure = msg
+
+class _LogWriter(logging.handlers.QueueListener):
+    """Writer thread for _QueuedLineLogger"""
+    
+    def enqueue_sentinel(self):
+        # Blocking put: a full queue has to drain before the stop marker fits
+        self.queue.put(self._sentinel)
+
+CHECK_NAMES = (
+    "system_resources", "agent_manager", "memory_usage", "coordination_health",
+    "active_agents", "agent_memory", "coordination_performance"
+)
+
+def healthcheck(name: str, failure_message: str):
+    """
+    Turn an async check body returning (status, message, metadata) into a timed
+    HealthCheck; exceptions become UNHEALTHY results and count as failed checks
+    """
+    def decorator(body):
+        @functools.wraps(body)
+        async def wrapper(self) -> HealthCheck:
+            # One wall-clock read for the timestamp; duration from the monotonic clock
+            timestamp = time.time()
+            start = time.monotonic()
+            
+            try:
+                status, message, metadata = await body(self)
+            except Exception as e:
+                status = HealthStatus.UNHEALTHY
+                message = f"{failure_message}: {e}"
+                metadata = {"error": str(e)}
+                self._fail_labels[name].inc()
+            
+            elapsed = time.monotonic() - start
+            self._dur_labels[name].observe(elapsed)
+            
+            return HealthCheck(name, status, message, timestamp, elapsed * 1000, metadata)
+        return wrapper
+    return decorator
+
+def _sample_system(include_disk: bool = True):
+    """psutil sample: (cpu percent since the previous sample, virtual memory, root disk usage or None)"""
+    disk = psutil.disk_usage('/') if include_disk else None
+    return psutil.cpu_percent(interval=None), psutil.virtual_memory(), disk
 
 class HealthMonitor:
     """
@@ -37,334 +128,402 @@ class HealthMonitor:
     health_check_duration = Histogram('health_check_duration_seconds', 'Health check execution time', ['check_name'])
     health_status_gauge = Gauge('health_status', 'Current health status (1=healthy, 0=unhealthy)', ['component'])
     failed_health_checks = Counter('failed_health_checks_total', 'Total failed health checks', ['check_name'])
+    log_records_dropped = Counter('health_log_records_dropped_total', 'Health monitor log lines dropped because the log queue was full')
+    
+    _DEEP_CHECKS = frozenset({"agent_memory", "coordination_performance"})
+    
+    # Worst-status ordering; 2 and above count as failed
+    _STATUS_SEVERITY = {
+        HealthStatus.HEALTHY: 0,
+        HealthStatus.DEGRADED: 1,
+        HealthStatus.UNHEALTHY: 2,
+        HealthStatus.CRITICAL: 3
+    }
     
     def __init__(self, agent_manager=None):
         self.logger = structlog.get_logger(__name__)
+        self._log_writer: Optional[_LogWriter] = None
+        self._line_logger: Optional[_QueuedLineLogger] = None
         self.agent_manager = agent_manager
-        self.health_checks: List[HealthCheck] = []
+        self.health_checks: Deque[HealthCheck] = deque(maxlen=1000)  # Recent check results
         self.last_full_check = 0
         
-    async def perform_full_health_check(self) -> Dict[str, Any]:
+        # Reused process handle; psutil caches static process info on the instance
+        self._proc = psutil.Process()
+        
+        # Seed the non-blocking CPU counter so the first check measures from here
+        psutil.cpu_percent(interval=None)
+        
+        # Label children bound once; .labels() is a locked dict lookup per call
+        self._dur_labels = {name: self.health_check_duration.labels(check_name=name) for name in CHECK_NAMES}
+        self._fail_labels = {name: self.failed_health_checks.labels(check_name=name) for name in CHECK_NAMES}
+        self._overall_status_gauge = self.health_status_gauge.labels(component="overall")
+        
+        # Last full report, reused for cache_ttl seconds
+        self.cache_ttl = 10.0
+        self._cached_report: Optional[Dict[str, Any]] = None
+        self._cached_at = 0.0
+        
+        # Filesystem and whole-heap probes run once every expensive_probe_interval
+        # checks; the runs in between reuse the last sampled values
+        self.expensive_probe_interval = 60
+        self._syscheck_counter = 0
+        self._memcheck_counter = 0
+        self._last_disk = None
+        self._last_gc_objects = 0
+        
+        # Per-check time limit; a check that overruns is reported unhealthy
+        self.check_timeout = 2.0
+        
+        # Deep checks run on this share of full reports; the others reuse the last result
+        self.deep_check_probability = 0.1
+        self._last_deep_checks: Dict[str, HealthCheck] = {}
+        
+    def start(self, max_queued_logs: int = 10000):
+        """
+        Move log writes onto a background thread: the event loop only renders and
+        enqueues, and lines beyond max_queued_logs pending are dropped and counted
+        in health_log_records_dropped_total. Until started, logs are written inline
+        """
+        if self._log_writer is not None:
+            return
+        
+        # Same processors and level filtering as the global structlog setup
+        config = structlog.get_config()
+        log_queue = queue.Queue(maxsize=max_queued_logs)
+        self._line_logger = _QueuedLineLogger(log_queue, self.log_records_dropped)
+        self.logger = structlog.wrap_logger(
+            self._line_logger,
+            processors=config["processors"],
+            wrapper_class=config["wrapper_class"],
+            context_class=config["context_class"]
+        )
+        self._log_writer = _LogWriter(log_queue, logging.StreamHandler(sys.stdout))
+        self._log_writer.start()
+    
+    def stop(self):
+        """Write out queued log lines, stop the writer thread and log inline again"""
+        if self._log_writer is None:
+            return
+        
+        self._log_writer.stop()  # Drains the queue before returning
+        dropped = self._line_logger.dropped
+        self._log_writer = self._line_logger = None
+        self.logger = structlog.get_logger(__name__)
+        
+        if dropped:
+            self.logger.warning("health_log_records_dropped", count=dropped)
+    
+    async def perform_full_health_check(self, force: bool = False) -> Dict[str, Any]:
         """
         Perform comprehensive health check of all components
+        Reports younger than cache_ttl are returned (flagged "cached") unless force is set
         """
-        start_time = time.time()
-        checks = []
+        if not force and self._cached_report is not None and time.monotonic() - self._cached_at < self.cache_ttl:
+            report = _copy_report(self._cached_report)
+            report["cached"] = True
+            return report
+        
+        start = time.monotonic()
         
         # Core system health
-        checks.append(await self._check_system_resources())
-        checks.append(await self._check_agent_manager())
-        checks.append(await self._check_memory_usage())
-        checks.append(await self._check_coordination_health())
+        check_names = ["system_resources", "agent_manager", "memory_usage", "coordination_health"]
+        coros = [
+            self._check_system_resources(),
+            self._check_agent_manager(),
+            self._check_memory_usage(),
+            self._check_coordination_health()
+        ]
         
         # Agent-specific health
         if self.agent_manager:
-            checks.append(await self._check_active_agents())
-            checks.append(await self._check_agent_memory())
-            checks.append(await self._check_coordination_performance())
+            check_names.append("active_agents")
+            coros.append(self._check_active_agents())
+            
+            run_deep = force or random.random() < self.deep_check_probability
+            for name, check in (("agent_memory", self._check_agent_memory),
+                                ("coordination_performance", self._check_coordination_performance)):
+                previous = self._last_deep_checks.get(name)
+                check_names.append(name)
+                coros.append(check() if run_deep or previous is None else self._reuse_check(previous))
+        
+        # Run all checks concurrently; a check that raises is reported as unhealthy
+        results = await asyncio.gather(
+            *(self._timed(name, coro) for name, coro in zip(check_names, coros)),
+            return_exceptions=True
+        )
+        checks = []
+        for name, result in zip(check_names, results):
+            if isinstance(result, BaseException):
+                self._fail_labels[name].inc()
+                result = HealthCheck(name, HealthStatus.UNHEALTHY, f"Health check raised: {result}",
+                                     time.time(), 0.0, {"error": str(result)})
+            checks.append(result)
+            if name in self._DEEP_CHECKS:
+                self._last_deep_checks[name] = result
+        
+        self.health_checks.extend(checks)
         
         # Overall health determination
-        overall_status = self._determine_overall_health(checks)
+        overall_status, summary = self._summarize(checks)
         
-        duration = time.time() - start_time
-        self.last_full_check = time.time()
+        finished = time.monotonic()
+        duration_ms = (finished - start) * 1000
+        status = overall_status.value
+        now = time.time()
+        self.last_full_check = now
         
         health_report = {
-            "status": overall_status.value,
-            "timestamp": time.time(),
-            "duration_ms": duration * 1000,
+            "status": status,
+            "timestamp": now,
+            "duration_ms": duration_ms,
             "checks": [self._serialize_check(check) for check in checks],
-            "summary": self._generate_health_summary(checks)
+            "summary": summary
         }
         
         # Update metrics
-        self.health_status_gauge.labels(component="overall").set(1 if overall_status == HealthStatus.HEALTHY else 0)
+        self._overall_status_gauge.set(1 if overall_status == HealthStatus.HEALTHY else 0)
         
         self.logger.info("health_check_completed", 
-                        status=overall_status.value, 
-                        duration_ms=duration * 1000,
+                        status=status, 
+                        duration_ms=duration_ms,
                         checks_count=len(checks))
         
-        return health_report
+        # The cached report stays private; every caller gets its own copy
+        self._cached_report = health_report
+        self._cached_at = finished
+        
+        return _copy_report(health_report)
     
-    async def _check_system_resources(self) -> HealthCheck:
+    @healthcheck("system_resources", "Failed to check system resources")
+    async def _check_system_resources(self):
         """Check system resource utilization"""
-        start_time = time.time()
+        # The disk probe touches the filesystem, so sampling runs on the default executor
+        sample_disk = self._last_disk is None or self._syscheck_counter % self.expensive_probe_interval == 0
+        self._syscheck_counter += 1
+        cpu_percent, memory, disk = await asyncio.get_running_loop().run_in_executor(
+            None, _sample_system, sample_disk
+        )
+        if disk is None:
+            disk = self._last_disk
+        else:
+            self._last_disk = disk
         
-        try:
-            cpu_percent = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
-            
-            # Determine health based on resource usage
-            if cpu_percent > 90 or memory.percent > 90 or disk.percent > 90:
-                status = HealthStatus.CRITICAL
-                message = f"High resource usage: CPU {cpu_percent}%, Memory {memory.percent}%, Disk {disk.percent}%"
-            elif cpu_percent > 70 or memory.percent > 70 or disk.percent > 80:
-                status = HealthStatus.DEGRADED
-                message = f"Moderate resource usage: CPU {cpu_percent}%, Memory {memory.percent}%, Disk {disk.percent}%"
-            else:
-                status = HealthStatus.HEALTHY
-                message = f"Normal resource usage: CPU {cpu_percent}%, Memory {memory.percent}%, Disk {disk.percent}%"
-            
-            metadata = {
-                "cpu_percent": cpu_percent,
-                "memory_percent": memory.percent,
-                "memory_available_gb": memory.available / (1024**3),
-                "disk_percent": disk.percent,
-                "disk_free_gb": disk.free / (1024**3)
-            }
-            
-        except Exception as e:
-            status = HealthStatus.UNHEALTHY
-            message = f"Failed to check system resources: {e}"
-            metadata = {"error": str(e)}
-            self.failed_health_checks.labels(check_name="system_resources").inc()
+        # Determine health based on resource usage
+        if cpu_percent > 90 or memory.percent > 90 or disk.percent > 90:
+            status = HealthStatus.CRITICAL
+            message = f"High resource usage: CPU {cpu_percent}%, Memory {memory.percent}%, Disk {disk.percent}%"
+        elif cpu_percent > 70 or memory.percent > 70 or disk.percent > 80:
+            status = HealthStatus.DEGRADED
+            message = f"Moderate resource usage: CPU {cpu_percent}%, Memory {memory.percent}%, Disk {disk.percent}%"
+        else:
+            status = HealthStatus.HEALTHY
+            message = f"Normal resource usage: CPU {cpu_percent}%, Memory {memory.percent}%, Disk {disk.percent}%"
         
-        duration = (time.time() - start_time) * 1000
-        self.health_check_duration.labels(check_name="system_resources").observe(duration / 1000)
+        metadata = {
+            "cpu_percent": cpu_percent,
+            "memory_percent": memory.percent,
+            "memory_available_gb": memory.available / (1024**3),
+            "disk_percent": disk.percent,
+            "disk_free_gb": disk.free / (1024**3)
+        }
         
-        return HealthCheck("system_resources", status, message, time.time(), duration, metadata)
+        return status, message, metadata
     
-    async def _check_agent_manager(self) -> HealthCheck:
+    @healthcheck("agent_manager", "Agent manager check failed")
+    async def _check_agent_manager(self):
         """Check agent manager health"""
-        start_time = time.time()
+        if not self.agent_manager:
+            return HealthStatus.UNHEALTHY, "Agent manager not initialized", {}
         
-        try:
-            if not self.agent_manager:
-                status = HealthStatus.UNHEALTHY
-                message = "Agent manager not initialized"
-                metadata = {}
-            else:
-                registry_size = len(self.agent_manager.get_agent_registry())
-                active_count = len(self.agent_manager.get_active_agents())
-                
-                if registry_size == 0:
-                    status = HealthStatus.CRITICAL
-                    message = "No agents in registry"
-                elif active_count > 20:  # Too many active agents
-                    status = HealthStatus.DEGRADED
-                    message = f"High active agent count: {active_count}"
-                else:
-                    status = HealthStatus.HEALTHY
-                    message = f"Agent manager healthy: {registry_size} registered, {active_count} active"
-                
-                metadata = {
-                    "registry_size": registry_size,
-                    "active_agents": active_count,
-                    "decision_history_length": len(self.agent_manager.decision_history)
-                }
-            
-        except Exception as e:
-            status = HealthStatus.UNHEALTHY
-            message = f"Agent manager check failed: {e}"
-            metadata = {"error": str(e)}
-            self.failed_health_checks.labels(check_name="agent_manager").inc()
+        registry_size = len(self.agent_manager.get_agent_registry())
+        active_count = len(self.agent_manager.get_active_agents())
+        
+        if registry_size == 0:
+            status = HealthStatus.CRITICAL
+            message = "No agents in registry"
+        elif active_count > 20:  # Too many active agents
+            status = HealthStatus.DEGRADED
+            message = f"High active agent count: {active_count}"
+        else:
+            status = HealthStatus.HEALTHY
+            message = f"Agent manager healthy: {registry_size} registered, {active_count} active"
         
-        duration = (time.time() - start_time) * 1000
-        self.health_check_duration.labels(check_name="agent_manager").observe(duration / 1000)
+        metadata = {
+            "registry_size": registry_size,
+            "active_agents": active_count,
+            "decision_history_length": len(self.agent_manager.decision_history)
+        }
         
-        return HealthCheck("agent_manager", status, message, time.time(), duration, metadata)
+        return status, message, metadata
     
-    async def _check_memory_usage(self) -> HealthCheck:
+    @healthcheck("memory_usage", "Memory check failed")
+    async def _check_memory_usage(self):
         """Check application memory usage"""
-        start_time = time.time()
-        
-        try:
-            import gc
+        import gc
+        if self._memcheck_counter % self.expensive_probe_interval == 0:
             gc.collect()
-            
-            process = psutil.Process()
-            memory_info = process.memory_info()
-            memory_mb = memory_info.rss / (1024 * 1024)
-            
-            # Memory thresholds
-            if memory_mb > 2048:  # 2GB
-                status = HealthStatus.CRITICAL
-                message = f"High memory usage: {memory_mb:.1f}MB"
-            elif memory_mb > 1024:  # 1GB
-                status = HealthStatus.DEGRADED
-                message = f"Moderate memory usage: {memory_mb:.1f}MB"
-            else:
-                status = HealthStatus.HEALTHY
-                message = f"Normal memory usage: {memory_mb:.1f}MB"
-            
-            metadata = {
-                "memory_mb": memory_mb,
-                "memory_percent": process.memory_percent(),
-                "gc_objects": len(gc.get_objects())
-            }
-            
-        except Exception as e:
-            status = HealthStatus.UNHEALTHY
-            message = f"Memory check failed: {e}"
-            metadata = {"error": str(e)}
-            self.failed_health_checks.labels(check_name="memory_usage").inc()
+            self._last_gc_objects = len(gc.get_objects())
+        self._memcheck_counter += 1
+        
+        process = self._proc
+        memory_info = process.memory_info()
+        memory_mb = memory_info.rss / (1024 * 1024)
+        
+        # Memory thresholds
+        if memory_mb > 2048:  # 2GB
+            status = HealthStatus.CRITICAL
+            message = f"High memory usage: {memory_mb:.1f}MB"
+        elif memory_mb > 1024:  # 1GB
+            status = HealthStatus.DEGRADED
+            message = f"Moderate memory usage: {memory_mb:.1f}MB"
+        else:
+            status = HealthStatus.HEALTHY
+            message = f"Normal memory usage: {memory_mb:.1f}MB"
         
-        duration = (time.time() - start_time) * 1000
-        self.health_check_duration.labels(check_name="memory_usage").observe(duration / 1000)
+        metadata = {
+            "memory_mb": memory_mb,
+            "memory_percent": process.memory_percent(),
+            "gc_objects": self._last_gc_objects
+        }
         
-        return HealthCheck("memory_usage", status, message, time.time(), duration, metadata)
+        return status, message, metadata
     
-    async def _check_coordination_health(self) -> HealthCheck:
+    @healthcheck("coordination_health", "Coordination health check failed")
+    async def _check_coordination_health(self):
         """Check agent coordination system health"""
-        start_time = time.time()
+        if not self.agent_manager:
+            return HealthStatus.UNHEALTHY, "No agent manager for coordination check", {}
         
-        try:
-            if not self.agent_manager:
-                status = HealthStatus.UNHEALTHY
-                message = "No agent manager for coordination check"
-                metadata = {}
-            else:
-                decision_count = len(self.agent_manager.decision_history)
-                
-                # Check recent decision success rate
-                recent_decisions = self.agent_manager.decision_history[-10:] if decision_count >= 10 else self.agent_manager.decision_history
-                
-                if not recent_decisions:
-                    status = HealthStatus.HEALTHY
-                    message = "No coordination decisions yet"
-                else:
-                    failed_decisions = sum(1 for d in recent_decisions if 'error' in d.get('result', {}))
-                    success_rate = (len(recent_decisions) - failed_decisions) / len(recent_decisions)
-                    
-                    if success_rate < 0.5:
-                        status = HealthStatus.CRITICAL
-                        message = f"Low coordination success rate: {success_rate:.2%}"
-                    elif success_rate < 0.8:
-                        status = HealthStatus.DEGRADED
-                        message = f"Moderate coordination success rate: {success_rate:.2%}"
-                    else:
-                        status = HealthStatus.HEALTHY
-                        message = f"Good coordination success rate: {success_rate:.2%}"
-                
-                metadata = {
-                    "total_decisions": decision_count,
-                    "recent_decisions": len(recent_decisions),
-                    "success_rate": success_rate if recent_decisions else 1.0
-                }
-            
-        except Exception as e:
-            status = HealthStatus.UNHEALTHY
-            message = f"Coordination health check failed: {e}"
-            metadata = {"error": str(e)}
-            self.failed_health_checks.labels(check_name="coordination_health").inc()
+        decision_count = self.agent_manager.decisions_total
         
-        duration = (time.time() - start_time) * 1000
-        self.health_check_duration.labels(check_name="coordination_health").observe(duration / 1000)
+        # Recent success rate is maintained by the agent manager per decision
+        recent_count = self.agent_manager.recent_decision_count
+        success_rate = self.agent_manager.recent_success_rate
         
-        return HealthCheck("coordination_health", status, message, time.time(), duration, metadata)
+        if not recent_count:
+            status = HealthStatus.HEALTHY
+            message = "No coordination decisions yet"
+        elif success_rate < 0.5:
+            status = HealthStatus.CRITICAL
+            message = f"Low coordination success rate: {success_rate:.2%}"
+        elif success_rate < 0.8:
+            status = HealthStatus.DEGRADED
+            message = f"Moderate coordination success rate: {success_rate:.2%}"
+        else:
+            status = HealthStatus.HEALTHY
+            message = f"Good coordination success rate: {success_rate:.2%}"
+        
+        metadata = {
+            "total_decisions": decision_count,
+            "recent_decisions": recent_count,
+            "success_rate": success_rate
+        }
+        
+        return status, message, metadata
     
-    async def _check_active_agents(self) -> HealthCheck:
+    @healthcheck("active_agents", "Active agent check failed")
+    async def _check_active_agents(self):
         """Check active agent health"""
-        start_time = time.time()
+        active_agents = self.agent_manager.get_active_agents()
+        agent_count = len(active_agents)
         
-        try:
-            active_agents = self.agent_manager.get_active_agents()
-            agent_count = len(active_agents)
-            
-            if agent_count == 0:
-                status = HealthStatus.HEALTHY
-                message = "No active agents (idle state)"
-            elif agent_count > 16:
-                status = HealthStatus.DEGRADED
-                message = f"High active agent count: {agent_count}"
-            else:
-                status = HealthStatus.HEALTHY
-                message = f"Normal active agent count: {agent_count}"
-            
-            # Check agent distribution by tier
-            tier_distribution = {}
-            for agent in active_agents.values():
-                tier = agent.tier.value
-                tier_distribution[tier] = tier_distribution.get(tier, 0) + 1
-            
-            metadata = {
-                "active_count": agent_count,
-                "tier_distribution": tier_distribution,
-                "agent_ids": list(active_agents.keys())
-            }
-            
-        except Exception as e:
-            status = HealthStatus.UNHEALTHY
-            message = f"Active agent check failed: {e}"
-            metadata = {"error": str(e)}
-            self.failed_health_checks.labels(check_name="active_agents").inc()
+        if agent_count == 0:
+            status = HealthStatus.HEALTHY
+            message = "No active agents (idle state)"
+        elif agent_count > 16:
+            status = HealthStatus.DEGRADED
+            message = f"High active agent count: {agent_count}"
+        else:
+            status = HealthStatus.HEALTHY
+            message = f"Normal active agent count: {agent_count}"
         
-        duration = (time.time() - start_time) * 1000
-        self.health_check_duration.labels(check_name="active_agents").observe(duration / 1000)
+        # Check agent distribution by tier
+        tier_distribution = dict(TallyCounter(agent.tier.value for agent in active_agents.values()))
+        
+        metadata = {
+            "active_count": agent_count,
+            "tier_distribution": tier_distribution,
+            "agent_ids": list(islice(active_agents, 20)),  # Capped to keep reports small
+            "agent_ids_truncated": agent_count > 20
+        }
         
-        return HealthCheck("active_agents", status, message, time.time(), duration, metadata)
+        return status, message, metadata
     
-    async def _check_agent_memory(self) -> HealthCheck:
+    @healthcheck("agent_memory", "Agent memory check failed")
+    async def _check_agent_memory(self):
         """Check agent memory and context usage"""
-        start_time = time.time()
+        # This would check agent-specific memory usage
+        # For now, it's a placeholder
+        return (
+            HealthStatus.HEALTHY,
+            "Agent memory check not implemented",
+            {"note": "Placeholder for agent memory monitoring"}
+        )
+    
+    @healthcheck("coordination_performance", "Coordination performance check failed")
+    async def _check_coordination_performance(self):
+        """Check coordination system performance"""
+        # Analyze recent coordination performance
+        if not self.agent_manager.decisions_total:
+            return HealthStatus.HEALTHY, "No coordination history to analyze", {}
         
-        try:
-            # This would check agent-specific memory usage
-            # For now, it's a placeholder
+        avg_duration = self.agent_manager.recent_avg_duration
+        
+        if avg_duration > 30:  # 30 seconds
+            status = HealthStatus.DEGRADED
+            message = f"Slow coordination: {avg_duration:.1f}s average"
+        else:
             status = HealthStatus.HEALTHY
-            message = "Agent memory check not implemented"
-            metadata = {"note": "Placeholder for agent memory monitoring"}
-            
-        except Exception as e:
-            status = HealthStatus.UNHEALTHY
-            message = f"Agent memory check failed: {e}"
-            metadata = {"error": str(e)}
-            self.failed_health_checks.labels(check_name="agent_memory").inc()
+            message = f"Good coordination performance: {avg_duration:.1f}s average"
         
-        duration = (time.time() - start_time) * 1000
-        self.health_check_duration.labels(check_name="agent_memory").observe(duration / 1000)
+        metadata = {
+            "avg_coordination_duration": avg_duration,
+            "recent_decisions_count": min(self.agent_manager.decisions_total, 5)
+        }
         
-        return HealthCheck("agent_memory", status, message, time.time(), duration, metadata)
+        return status, message, metadata
     
-    async def _check_coordination_performance(self) -> HealthCheck:
-        """Check coordination system performance"""
-        start_time = time.time()
-        
+    async def _timed(self, name: str, coro) -> HealthCheck:
+        """Await a check within check_timeout so one stuck probe can't hold up the report"""
         try:
-            # Analyze recent coordination performance
-            if not self.agent_manager.decision_history:
-                status = HealthStatus.HEALTHY
-                message = "No coordination history to analyze"
-                metadata = {}
-            else:
-                recent_decisions = self.agent_manager.decision_history[-5:]
-                avg_duration = sum(d.get('result', {}).get('duration', 0) for d in recent_decisions) / len(recent_decisions)
-                
-                if avg_duration > 30:  # 30 seconds
-                    status = HealthStatus.DEGRADED
-                    message = f"Slow coordination: {avg_duration:.1f}s average"
-                else:
-                    status = HealthStatus.HEALTHY
-                    message = f"Good coordination performance: {avg_duration:.1f}s average"
-                
-                metadata = {
-                    "avg_coordination_duration": avg_duration,
-                    "recent_decisions_count": len(recent_decisions)
-                }
-            
-        except Exception as e:
-            status = HealthStatus.UNHEALTHY
-            message = f"Coordination performance check failed: {e}"
-            metadata = {"error": str(e)}
-            self.failed_health_checks.labels(check_name="coordination_performance").inc()
+            return await asyncio.wait_for(coro, self.check_timeout)
+        except asyncio.TimeoutError:
+            self._fail_labels[name].inc()
+            return HealthCheck(name, HealthStatus.UNHEALTHY, f"Health check timed out after {self.check_timeout}s",
+                               time.time(), self.check_timeout * 1000, {"error": "timeout"})
+    
+    async def _reuse_check(self, previous: HealthCheck) -> HealthCheck:
+        """Stand-in for a skipped deep check: the last result, keeping its timestamp and marked stale"""
+        return replace(previous, metadata={**previous.metadata, "sampled_at": previous.timestamp, "stale": True})
+    
+    def _summarize(self, checks: List[HealthCheck]) -> Tuple[HealthStatus, Dict[str, Any]]:
+        """Overall status (worst check) and summary statistics in a single pass over the checks"""
+        severity = self._STATUS_SEVERITY
+        worst = HealthStatus.HEALTHY
+        worst_severity = 0
+        status_counts = {}
+        failed_checks = []
+        degraded_checks = []
         
-        duration = (time.time() - start_time) * 1000
-        self.health_check_duration.labels(check_name="coordination_performance").observe(duration / 1000)
+        for check in checks:
+            status = check.status
+            status_counts[status.value] = status_counts.get(status.value, 0) + 1
+            
+            level = severity[status]
+            if level > worst_severity:
+                worst, worst_severity = status, level
+            if level >= 2:
+                failed_checks.append(check.name)
+            elif level == 1:
+                degraded_checks.append(check.name)
         
-        return HealthCheck("coordination_performance", status, message, time.time(), duration, metadata)
-    
-    def _determine_overall_health(self, checks: List[HealthCheck]) -> HealthStatus:
-        """Determine overall health status from individual checks"""
-        if any(check.status == HealthStatus.CRITICAL for check in checks):
-            return HealthStatus.CRITICAL
-        elif any(check.status == HealthStatus.UNHEALTHY for check in checks):
-            return HealthStatus.UNHEALTHY
-        elif any(check.status == HealthStatus.DEGRADED for check in checks):
-            return HealthStatus.DEGRADED
-        else:
-            return HealthStatus.HEALTHY
+        return worst, {
+            "total_checks": len(checks),
+            "status_distribution": status_counts,
+            "failed_checks": failed_checks,
+            "degraded_checks": degraded_checks
+        }
     
     def _serialize_check(self, check: HealthCheck) -> Dict[str, Any]:
         """Serialize health check for JSON output"""
@@ -374,37 +533,42 @@ class HealthMonitor:
             "message": check.message,
             "timestamp": check.timestamp,
             "duration_ms": check.duration_ms,
-            "metadata": check.metadata or {}
-        }
-    
-    def _generate_health_summary(self, checks: List[HealthCheck]) -> Dict[str, Any]:
-        """Generate summary statistics from health checks"""
-        status_counts = {}
-        for check in checks:
-            status = check.status.value
-            status_counts[status] = status_counts.get(status, 0) + 1
-        
-        return {
-            "total_checks": len(checks),
-            "status_distribution": status_counts,
-            "failed_checks": [check.name for check in checks if check.status in [HealthStatus.UNHEALTHY, HealthStatus.CRITICAL]],
-            "degraded_checks": [check.name for check in checks if check.status == HealthStatus.DEGRADED]
+            "metadata": check.metadata
         }
     
     async def get_readiness_probe(self) -> Dict[str, Any]:
-        """Kubernetes readiness probe endpoint"""
+        """
+        Kubernetes readiness probe endpoint
+        Answers from the cached full report; when none is fresh it runs only the
+        cheap agent manager check. /health/full (perform_full_health_check) is
+        the endpoint that runs every sub-check
+        """
         try:
             # Quick checks for readiness
             ready = True
             message = "Service ready"
+            health_status = None
             
             if self.agent_manager is None:
                 ready = False
                 message = "Agent manager not initialized"
+            elif self._cached_report is not None and time.monotonic() - self._cached_at < self.cache_ttl:
+                health_status = self._cached_report["status"]
+                if health_status in (HealthStatus.UNHEALTHY.value, HealthStatus.CRITICAL.value):
+                    ready = False
+                    message = f"Last health check reported {health_status}"
+            else:
+                # No fresh report to go on, so check the agent manager inline
+                check = await self._timed("agent_manager", self._check_agent_manager())
+                health_status = check.status.value
+                if check.status in (HealthStatus.UNHEALTHY, HealthStatus.CRITICAL):
+                    ready = False
+                    message = check.message
             
             return {
                 "ready": ready,
                 "message": message,
+                "health_status": health_status,
                 "timestamp": time.time()
             }
         except Exception as e:
@@ -4,20 +4,31 @@ Implements circuit breakers, retries, and graceful degradation
 """
 
 import asyncio
+import os
+import random
+import sys
+import threading
 import time
 from typing import Dict, List, Optional, Any, Callable
 from dataclasses import dataclass
 from enum import Enum
 import functools
-from prometheus_client import Counter, Histogram, Gauge
+from bisect import bisect_left
+from collections import Counter as TallyCounter
+from prometheus_client import Counter, Gauge, REGISTRY
+from prometheus_client.core import CounterMetricFamily, HistogramMetricFamily
+from prometheus_client.utils import floatToGoString
 import structlog
 
+# asyncio.timeout() (3.11+) arms a timer on the current task instead of wrapping it in a new one
+_HAS_ASYNCIO_TIMEOUT = sys.version_info >= (3, 11)
+
 class CircuitState(Enum):
     CLOSED = "closed"      # Normal operation
     OPEN = "open"          # Failing, blocking requests
     HALF_OPEN = "half_open"  # Testing if service recovered
 
-@dataclass
+@dataclass(slots=True)
 class RetryConfig:
     max_attempts: int = 3
     initial_delay: float = 1.0
@@ -25,7 +36,7 @@ class RetryConfig:
     backoff_multiplier: float = 2.0
     jitter: bool = True
 
-@dataclass
+@dataclass(slots=True)
 class CircuitBreakerConfig:
     failure_threshold: int = 5
     recovery_timeout: float = 60.0
@@ -57,150 +68,304 @@ class CircuitBreaker:
     circuit_breaker_state = Gauge('circuit_breaker_state', 'Circuit breaker state (0=closed, 1=open, 2=half_open)', ['circuit_name'])
     circuit_breaker_trips = Counter('circuit_breaker_trips_total', 'Total circuit breaker trips', ['circuit_name'])
     
-    def __init__(self, name: str, config: CircuitBreakerConfig):
+    __slots__ = (
+        'name', 'config', 'defer_metrics', 'state', 'failure_count', 'success_count',
+        'last_failure_time', 'recovery_timeout_ns', '_open_error_msg', 'logger', '_lock',
+        '_state_gauge', '_trip_counter', '_pending_state'
+    )
+    
+    def __init__(self, name: str, config: CircuitBreakerConfig, defer_metrics: bool = False):
         self.name = name
         self.config = config
+        self.defer_metrics = defer_metrics  # Gauge written by flush_state_metric() instead of on transition
         self.state = CircuitState.CLOSED
         self.failure_count = 0
         self.success_count = 0
-        self.last_failure_time = 0
-        self.logger = structlog.get_logger(__name__)
+        self.last_failure_time = 0  # time.monotonic_ns() of the last failure
+        self.recovery_timeout_ns = int(config.recovery_timeout * 1e9)
+        self._open_error_msg = f"Circuit breaker {name} is OPEN"
+        self.logger = structlog.get_logger(__name__).bind(circuit=name)
+        
+        # Guards state and counters; the decorators may be driven from several threads
+        self._lock = threading.Lock()
+        
+        # Bind label children once; transitions update them directly
+        self._state_gauge = self.circuit_breaker_state.labels(circuit_name=name)
+        self._trip_counter = self.circuit_breaker_trips.labels(circuit_name=name)
+        
+        self._pending_state: Optional[int] = None
         
         # Update initial metric
-        self.circuit_breaker_state.labels(circuit_name=name).set(0)
+        self._state_gauge.set(0)
     
     async def call(self, func: Callable, *args, **kwargs):
         """
         Execute function through circuit breaker
         """
         if self.state == CircuitState.OPEN:
-            if time.time() - self.last_failure_time > self.config.recovery_timeout:
+            if time.monotonic_ns() - self.last_failure_time > self.recovery_timeout_ns:
                 self._transition_to_half_open()
             else:
-                raise AgentError(f"Circuit breaker {self.name} is OPEN")
+                raise AgentError(self._open_error_msg)
         
         try:
             # Execute with timeout
-            result = await asyncio.wait_for(
-                func(*args, **kwargs),
-                timeout=self.config.timeout
-            )
+            if _HAS_ASYNCIO_TIMEOUT:
+                async with asyncio.timeout(self.config.timeout):
+                    result = await func(*args, **kwargs)
+            else:
+                result = await asyncio.wait_for(
+                    func(*args, **kwargs),
+                    timeout=self.config.timeout
+                )
             
             self._on_success()
             return result
             
-        except Exception as e:
+        except asyncio.CancelledError:
+            # Cancellation says nothing about the health of the operation
+            raise
+        except asyncio.TimeoutError as e:
+            self._on_failure()
+            raise TimeoutError(f"Circuit breaker {self.name} timed out after {self.config.timeout}s") from e
+        except Exception:
             self._on_failure()
-            raise AgentError(f"Circuit breaker {self.name} failed: {e}")
+            raise
+    
+    def _compare_and_set(self, expected: CircuitState, new: CircuitState) -> bool:
+        """Move from expected to new state; False if another caller got there first"""
+        with self._lock:
+            if self.state is not expected:
+                return False
+            self.state = new
+            self.success_count = 0
+            if new is CircuitState.CLOSED:
+                self.failure_count = 0
+        return True
     
     def _on_success(self):
         """Handle successful operation"""
-        if self.state == CircuitState.HALF_OPEN:
+        with self._lock:
+            if self.state is not CircuitState.HALF_OPEN:
+                self.failure_count = 0
+                return
             self.success_count += 1
-            if self.success_count >= self.config.success_threshold:
-                self._transition_to_closed()
-        else:
-            self.failure_count = 0
+            recovered = self.success_count >= self.config.success_threshold
+        
+        if recovered:
+            self._transition_to_closed()
     
     def _on_failure(self):
         """Handle failed operation"""
-        self.failure_count += 1
-        self.last_failure_time = time.time()
+        with self._lock:
+            self.failure_count += 1
+            self.last_failure_time = time.monotonic_ns()
+            tripped = self.failure_count >= self.config.failure_threshold
+            current = self.state
         
-        if self.failure_count >= self.config.failure_threshold:
-            self._transition_to_open()
+        if tripped and current is not CircuitState.OPEN:
+            self._transition_to_open(current)
+    
+    def _publish_state(self, value: int):
+        """Report a state change to the gauge, now or at the next flush"""
+        if self.defer_metrics:
+            self._pending_state = value
+        else:
+            self._state_gauge.set(value)
+    
+    def flush_state_metric(self):
+        """Write the latest deferred state, if any, to the gauge"""
+        with self._lock:
+            value, self._pending_state = self._pending_state, None
+        if value is not None:
+            self._state_gauge.set(value)
     
     def _transition_to_closed(self):
         """Transition to closed state"""
-        self.state = CircuitState.CLOSED
-        self.failure_count = 0
-        self.success_count = 0
-        self.circuit_breaker_state.labels(circuit_name=self.name).set(0)
-        self.logger.info("circuit_breaker_closed", circuit=self.name)
+        # Only the caller that wins the transition reports it
+        if not self._compare_and_set(CircuitState.HALF_OPEN, CircuitState.CLOSED):
+            return
+        self._publish_state(0)
+        self.logger.info("circuit_breaker_closed")
     
-    def _transition_to_open(self):
+    def _transition_to_open(self, expected: CircuitState):
         """Transition to open state"""
-        self.state = CircuitState.OPEN
-        self.circuit_breaker_trips.labels(circuit_name=self.name).inc()
-        self.circuit_breaker_state.labels(circuit_name=self.name).set(1)
-        self.logger.warning("circuit_breaker_opened", circuit=self.name, failure_count=self.failure_count)
+        if not self._compare_and_set(expected, CircuitState.OPEN):
+            return
+        self._trip_counter.inc()
+        self._publish_state(1)
+        self.logger.warning("circuit_breaker_opened", failure_count=self.failure_count)
     
     def _transition_to_half_open(self):
         """Transition to half-open state"""
-        self.state = CircuitState.HALF_OPEN
-        self.success_count = 0
-        self.circuit_breaker_state.labels(circuit_name=self.name).set(2)
-        self.logger.info("circuit_breaker_half_open", circuit=self.name)
+        if not self._compare_and_set(CircuitState.OPEN, CircuitState.HALF_OPEN):
+            return
+        self._publish_state(2)
+        self.logger.info("circuit_breaker_half_open")
+
+# Jitter RNG per thread, so concurrent retries do not share the module-level generator
+_rng_local = threading.local()
+
+def _thread_rng() -> random.Random:
+    rng = getattr(_rng_local, "rng", None)
+    if rng is None:
+        rng = _rng_local.rng = random.Random(os.urandom(8))
+    return rng
+
+def _set_result_unless_done(fut: asyncio.Future):
+    if not fut.done():
+        fut.set_result(None)
+
+async def _sleep(delay: float):
+    """asyncio.sleep() as one timer and a bare future, without sleep's extra bookkeeping"""
+    # The running loop is looked up per call; the shared manager may serve several loops
+    loop = asyncio.get_running_loop()
+    fut = loop.create_future()
+    handle = loop.call_later(delay, _set_result_unless_done, fut)
+    try:
+        await fut
+    finally:
+        handle.cancel()
+
+# Retry duration buckets: powers of two from 1ms to ~131s
+RETRY_DURATION_BUCKETS = tuple(2.0 ** i / 1000 for i in range(18))
+
+class RetryMetricsCollector:
+    """
+    In-process aggregation of retry metrics
+    Events only bump plain counters and histogram bins; the Prometheus
+    series are synthesized from them when the registry is scraped.
+    """
+    
+    def __init__(self):
+        self.attempts: TallyCounter = TallyCounter()  # (operation, attempt) -> count
+        self.duration_bins: Dict[str, List[int]] = {}
+        self.duration_sums: Dict[str, float] = {}
+    
+    def record_attempt(self, operation: str, attempt: int):
+        self.attempts[(operation, attempt)] += 1
+    
+    def observe_duration(self, operation: str, duration: float):
+        bins = self.duration_bins.get(operation)
+        if bins is None:
+            # Last bin is +Inf
+            bins = self.duration_bins[operation] = [0] * (len(RETRY_DURATION_BUCKETS) + 1)
+            self.duration_sums[operation] = 0.0
+        bins[bisect_left(RETRY_DURATION_BUCKETS, duration)] += 1
+        self.duration_sums[operation] += duration
+    
+    def collect(self):
+        attempts = CounterMetricFamily('retry_attempts', 'Total retry attempts', labels=['operation', 'attempt'])
+        for (operation, attempt), count in list(self.attempts.items()):
+            attempts.add_metric([operation, str(attempt)], count)
+        yield attempts
+        
+        duration = HistogramMetricFamily('retry_duration_seconds', 'Total retry duration', labels=['operation'])
+        edges = RETRY_DURATION_BUCKETS + (float('inf'),)
+        for operation, bins in list(self.duration_bins.items()):
+            cumulative = 0
+            buckets = []
+            for edge, count in zip(edges, bins):
+                cumulative += count
+                buckets.append((floatToGoString(edge), cumulative))
+            duration.add_metric([operation], buckets, sum_value=self.duration_sums[operation])
+        yield duration
 
 class RetryHandler:
     """
     Retry handler with exponential backoff and jitter
+    
+    Jitter is "full jitter" (uniform between zero and the capped backoff), as
+    recommended in AWS's "Exponential Backoff And Jitter" article; it spreads
+    competing clients out better than scaling the delay around its midpoint.
     """
     
-    retry_attempts = Counter('retry_attempts_total', 'Total retry attempts', ['operation', 'attempt'])
-    retry_duration = Histogram('retry_duration_seconds', 'Total retry duration', ['operation'])
+    metrics = RetryMetricsCollector()
+    REGISTRY.register(metrics)
+    
+    __slots__ = ('config', 'logger', '_operation_loggers', '_base_delays')
     
     def __init__(self, config: RetryConfig):
         self.config = config
         self.logger = structlog.get_logger(__name__)
+        self._operation_loggers: Dict[str, Any] = {}  # operation -> logger bound to it
+        
+        # Capped backoff per attempt is fixed by the config; only jitter varies
+        self._base_delays = tuple(
+            min(config.initial_delay * config.backoff_multiplier ** i, config.max_delay)
+            for i in range(config.max_attempts)
+        )
     
     async def retry(self, operation: str, func: Callable, *args, **kwargs):
         """
         Execute function with retry logic
         """
+        # Fast path: a first-time success is neither timed nor counted
+        try:
+            return await func(*args, **kwargs)
+        except Exception as e:
+            first_error = e
+        
+        return await self._retry_slow(operation, func, first_error, args, kwargs)
+    
+    async def _retry_slow(self, operation: str, func: Callable, first_error: Exception, args: tuple, kwargs: dict):
+        """Retry loop, entered once the first attempt has failed"""
         start_time = time.time()
-        last_exception = None
+        self.metrics.record_attempt(operation, 1)
+        last_exception = first_error
+        logger = self._logger_for(operation)
+        attempt = 0
         
-        for attempt in range(self.config.max_attempts):
+        while attempt + 1 < self.config.max_attempts:
+            # Check if error is retryable; only AgentError carries the flag
+            if getattr(last_exception, 'recoverable', True) is False:
+                logger.error("non_retryable_error", error=str(last_exception))
+                break
+            
+            delay = self._calculate_delay(attempt)
+            logger.warning("retry_attempt_failed", 
+                           attempt=attempt + 1, 
+                           error=str(last_exception), 
+                           next_delay=delay)
+            
+            await _sleep(delay)
+            
+            attempt += 1
+            self.metrics.record_attempt(operation, attempt + 1)
             try:
-                self.retry_attempts.labels(operation=operation, attempt=attempt + 1).inc()
                 result = await func(*args, **kwargs)
-                
-                if attempt > 0:
-                    duration = time.time() - start_time
-                    self.retry_duration.labels(operation=operation).observe(duration)
-                    self.logger.info("retry_succeeded", operation=operation, attempt=attempt + 1, duration=duration)
-                
-                return result
-                
             except Exception as e:
                 last_exception = e
-                
-                if attempt + 1 >= self.config.max_attempts:
-                    break
-                
-                # Check if error is retryable
-                if isinstance(e, AgentError) and not e.recoverable:
-                    self.logger.error("non_retryable_error", operation=operation, error=str(e))
-                    break
-                
-                delay = self._calculate_delay(attempt)
-                self.logger.warning("retry_attempt_failed", 
-                                  operation=operation, 
-                                  attempt=attempt + 1, 
-                                  error=str(e), 
-                                  next_delay=delay)
-                
-                await asyncio.sleep(delay)
+                continue
+            
+            duration = time.time() - start_time
+            self.metrics.observe_duration(operation, duration)
+            logger.info("retry_succeeded", attempt=attempt + 1, duration=duration)
+            return result
         
         # All retries failed
         duration = time.time() - start_time
-        self.retry_duration.labels(operation=operation).observe(duration)
-        self.logger.error("retry_exhausted", operation=operation, attempts=self.config.max_attempts, duration=duration)
+        self.metrics.observe_duration(operation, duration)
+        logger.error("retry_exhausted", attempts=self.config.max_attempts, duration=duration)
         raise last_exception
     
+    def _logger_for(self, operation: str):
+        """Logger with the operation pre-bound, cached per operation"""
+        logger = self._operation_loggers.get(operation)
+        if logger is None:
+            if len(self._operation_loggers) >= 256:
+                self._operation_loggers.clear()
+            logger = self._operation_loggers[operation] = self.logger.bind(operation=operation)
+        return logger
+    
     def _calculate_delay(self, attempt: int) -> float:
         """Calculate delay for next retry attempt"""
-        delay = min(
-            self.config.initial_delay * (self.config.backoff_multiplier ** attempt),
-            self.config.max_delay
-        )
+        capped_base_delay = self._base_delays[attempt]
         
-        if self.config.jitter:
-            import random
-            delay *= (0.5 + random.random())
+        if not self.config.jitter:
+            return capped_base_delay
         
-        return delay
+        return _thread_rng().uniform(0, capped_base_delay)
 
 class ErrorRecoveryManager:
     """
@@ -209,11 +374,25 @@ class ErrorRecoveryManager:
     
     error_recovery_attempts = Counter('error_recovery_attempts_total', 'Error recovery attempts', ['error_type', 'status'])
     
-    def __init__(self):
+    def __init__(self, metrics_flush_interval: float = 0.1):
         self.circuit_breakers: Dict[str, CircuitBreaker] = {}
         self.retry_handler = RetryHandler(RetryConfig())
         self.logger = structlog.get_logger(__name__)
         
+        # Breaker state gauges are written on transition, or batched by one
+        # background task while start_metrics_flusher() is in effect
+        self.metrics_flush_interval = metrics_flush_interval
+        self._flush_task: Optional[asyncio.Task] = None
+        
+        self._executors: Dict[str, Callable] = {}
+        
+        # Recovery handler per error type; subclasses resolve through _dispatch_for
+        self._handlers: Dict[type, Callable] = {
+            ResourceExhaustionError: self._handle_resource_exhaustion,
+            CoordinationError: self._handle_coordination_error
+        }
+        self._label_cache: Dict[type, tuple] = {}  # type -> (handler, type name, counters by status)
+        
         # Initialize circuit breakers for key operations
         self._initialize_circuit_breakers()
     
@@ -227,50 +406,111 @@ class ErrorRecoveryManager:
         }
         
         for name, config in configs.items():
+            name = sys.intern(name)
             self.circuit_breakers[name] = CircuitBreaker(name, config)
     
+    def start_metrics_flusher(self):
+        """
+        Batch breaker gauge writes: transitions only record their state and a task
+        on the running loop writes it every metrics_flush_interval until
+        stop_metrics_flusher() is awaited
+        """
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+        self._flush_task = asyncio.get_running_loop().create_task(self._flush_metrics_loop())
+        for breaker in list(self.circuit_breakers.values()):
+            breaker.defer_metrics = True
+    
+    async def stop_metrics_flusher(self):
+        """Stop the flush task, write pending states and go back to writing gauges on transition"""
+        task, self._flush_task = self._flush_task, None
+        for breaker in list(self.circuit_breakers.values()):
+            breaker.defer_metrics = False
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self.flush_metrics()
+    
+    async def _flush_metrics_loop(self):
+        while True:
+            await asyncio.sleep(self.metrics_flush_interval)
+            self.flush_metrics()
+    
+    def flush_metrics(self):
+        """Write pending circuit breaker states to their gauges"""
+        for breaker in list(self.circuit_breakers.values()):
+            breaker.flush_state_metric()
+    
     def get_circuit_breaker(self, name: str) -> CircuitBreaker:
         """Get or create circuit breaker"""
-        if name not in self.circuit_breakers:
-            self.circuit_breakers[name] = CircuitBreaker(name, CircuitBreakerConfig())
-        return self.circuit_breakers[name]
+        try:
+            return self.circuit_breakers[name]
+        except KeyError:
+            name = sys.intern(name)
+            breaker = self.circuit_breakers[name] = CircuitBreaker(
+                name, CircuitBreakerConfig(), defer_metrics=self._flush_task is not None
+            )
+            return breaker
+    
+    def _get_executor(self, operation: str) -> Callable:
+        """Retry-around-breaker callable for an operation, built once per operation"""
+        try:
+            return self._executors[operation]
+        except KeyError:
+            circuit_breaker = self.get_circuit_breaker(operation)
+            # The breaker's bound call takes the function as its first argument,
+            # so retry can drive it directly without a per-call wrapper closure
+            executor = self._executors[operation] = functools.partial(
+                self.retry_handler.retry, operation, circuit_breaker.call
+            )
+            return executor
     
     async def execute_with_resilience(self, operation: str, func: Callable, *args, **kwargs):
         """
         Execute operation with full resilience (circuit breaker + retry)
         """
-        circuit_breaker = self.get_circuit_breaker(operation)
-        
-        async def wrapped_operation():
-            return await circuit_breaker.call(func, *args, **kwargs)
-        
-        return await self.retry_handler.retry(operation, wrapped_operation)
+        return await self._get_executor(operation)(func, *args, **kwargs)
+    
+    def _dispatch_for(self, error_type: type) -> tuple:
+        """Recovery handler, type name and bound counters for an error type, resolved once"""
+        entry = self._label_cache.get(error_type)
+        if entry is None:
+            handler = self._handlers.get(error_type) or next(
+                (h for t, h in self._handlers.items() if issubclass(error_type, t)),
+                self._handle_generic_error
+            )
+            name = error_type.__name__
+            counters = {
+                status: self.error_recovery_attempts.labels(error_type=name, status=status)
+                for status in ("attempted", "success", "failed", "error")
+            }
+            entry = self._label_cache[error_type] = (handler, name, counters)
+        return entry
     
     async def handle_agent_error(self, error: AgentError, agent_id: str = None) -> bool:
         """
         Handle specific agent error and attempt recovery
         """
+        handler, error_type, counters = self._dispatch_for(type(error))
         try:
-            self.error_recovery_attempts.labels(error_type=type(error).__name__, status="attempted").inc()
+            counters["attempted"].inc()
             
-            if isinstance(error, ResourceExhaustionError):
-                success = await self._handle_resource_exhaustion(error, agent_id)
-            elif isinstance(error, CoordinationError):
-                success = await self._handle_coordination_error(error, agent_id)
-            else:
-                success = await self._handle_generic_error(error, agent_id)
+            success = await handler(error, agent_id)
             
             if success:
-                self.error_recovery_attempts.labels(error_type=type(error).__name__, status="success").inc()
-                self.logger.info("error_recovery_successful", error_type=type(error).__name__, agent_id=agent_id)
+                counters["success"].inc()
+                self.logger.info("error_recovery_successful", error_type=error_type, agent_id=agent_id)
             else:
-                self.error_recovery_attempts.labels(error_type=type(error).__name__, status="failed").inc()
-                self.logger.error("error_recovery_failed", error_type=type(error).__name__, agent_id=agent_id)
+                counters["failed"].inc()
+                self.logger.error("error_recovery_failed", error_type=error_type, agent_id=agent_id)
             
             return success
             
         except Exception as recovery_error:
-            self.error_recovery_attempts.labels(error_type=type(error).__name__, status="error").inc()
+            counters["error"].inc()
             self.logger.error("error_recovery_exception", 
                             original_error=str(error), 
                             recovery_error=str(recovery_error), 
@@ -309,17 +549,40 @@ class ErrorRecoveryManager:
         await asyncio.sleep(1)  # Brief pause
         return error.recoverable
 
+def _light_wraps(wrapper, func):
+    """Cheaper functools.wraps: copy the identifying attributes, not __dict__"""
+    wrapper.__wrapped__ = func
+    wrapper.__module__ = func.__module__
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__doc__ = func.__doc__
+    return wrapper
+
+# Shared by the decorators so breaker state persists across calls
+_default_manager: Optional[ErrorRecoveryManager] = None
+_default_manager_lock = threading.Lock()
+
+def _get_default_manager() -> ErrorRecoveryManager:
+    """Get the process-wide recovery manager, creating it on first use"""
+    global _default_manager
+    if _default_manager is None:
+        with _default_manager_lock:
+            if _default_manager is None:
+                _default_manager = ErrorRecoveryManager()
+    return _default_manager
+
 def with_circuit_breaker(circuit_name: str, config: CircuitBreakerConfig = None):
     """
     Decorator to add circuit breaker to a function
     """
     def decorator(func):
-        @functools.wraps(func)
+        # Resolved at decoration time; the shared manager keeps the breaker alive
+        recovery_manager = _get_default_manager()
+        circuit_breaker = recovery_manager.get_circuit_breaker(circuit_name)
+        
         async def wrapper(*args, **kwargs):
-            recovery_manager = ErrorRecoveryManager()
-            circuit_breaker = recovery_manager.get_circuit_breaker(circuit_name)
             return await circuit_breaker.call(func, *args, **kwargs)
-        return wrapper
+        return _light_wraps(wrapper, func)
     return decorator
 
 def with_retry(config: RetryConfig = None):
@@ -330,11 +593,11 @@ def with_retry(config: RetryConfig = None):
     retry_handler = RetryHandler(retry_config)
     
     def decorator(func):
-        @functools.wraps(func)
+        operation_name = sys.intern(f"{func.__module__}.{func.__name__}")
+        
         async def wrapper(*args, **kwargs):
-            operation_name = f"{func.__module__}.{func.__name__}"
             return await retry_handler.retry(operation_name, func, *args, **kwargs)
-        return wrapper
+        return _light_wraps(wrapper, func)
     return decorator
 
 def with_resilience(circuit_name: str = None, retry_config: RetryConfig = None):
@@ -342,10 +605,11 @@ def with_resilience(circuit_name: str = None, retry_config: RetryConfig = None):
     Decorator to add full resilience (circuit breaker + retry) to a function
     """
     def decorator(func):
-        @functools.wraps(func)
+        operation_name = circuit_name or f"{func.__module__}.{func.__name__}"
+        recovery_manager = _get_default_manager()
+        executor = recovery_manager._get_executor(operation_name)
+        
         async def wrapper(*args, **kwargs):
-            operation_name = circuit_name or f"{func.__module__}.{func.__name__}"
-            recovery_manager = ErrorRecoveryManager()
-            return await recovery_manager.execute_with_resilience(operation_name, func, *args, **kwargs)
-        return wrapper
-    return decorator
\ No newline at end of file
+            return await executor(func, *args, **kwargs)
+        return _light_wraps(wrapper, func)
+    return decorator
@@ -5,40 +5,129 @@ Provides swarm intelligence and hive mind capabilities to Claude Code
 """
 
 import asyncio
+import functools
+import itertools
 import json
 import logging
+import signal
 import sys
-from typing import Any, Dict, List, Optional, Sequence
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 from pathlib import Path
 
 # Add the project root to the path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+try:
+    import orjson
+except ImportError:  # stdlib fallback
+    orjson = None
+
+try:
+    import fastjsonschema
+except ImportError:  # required-keys check only
+    fastjsonschema = None
+
 from core.coordination.swarm_hive_coordinator import (
     SwarmHiveCoordinator, 
     CoordinationTask, 
     CoordinationMode
 )
+from core.coordination.swarm_manager import SwarmTopology
+from core.coordination.hive_intelligence import HiveDecisionMethod, HiveMemoryType
 from core.agents.agent_manager import AgentManager
 
+# Tool argument string -> enum lookups
+_TOPOLOGY_MAP = {
+    "hierarchical": SwarmTopology.HIERARCHICAL,
+    "mesh": SwarmTopology.MESH,
+    "collective": SwarmTopology.COLLECTIVE,
+    "adaptive": SwarmTopology.ADAPTIVE
+}
+
+_HIVE_METHOD_MAP = {
+    "consensus": HiveDecisionMethod.CONSENSUS,
+    "weighted_voting": HiveDecisionMethod.WEIGHTED_VOTING,
+    "quorum": HiveDecisionMethod.QUORUM,
+    "emergent": HiveDecisionMethod.EMERGENT
+}
+
+_MEMORY_TYPE_MAP = {
+    "working": HiveMemoryType.WORKING,
+    "episodic": HiveMemoryType.EPISODIC,
+    "semantic": HiveMemoryType.SEMANTIC,
+    "collective": HiveMemoryType.COLLECTIVE
+}
+
+# Tool results go to a machine client, so they are serialized compactly
+if orjson is not None:
+    def _dumps_result(result: Dict[str, Any]) -> str:
+        return orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+else:
+    def _dumps_result(result: Dict[str, Any]) -> str:
+        return json.dumps(result, separators=(",", ":"))
+
+@dataclass(slots=True, frozen=True)
+class AgentSnapshot:
+    """Registry fields the tool handlers read, captured once per registry generation"""
+    id: str
+    name: str
+    tier: str
+    caps_list: Tuple[str, ...]
+    caps_set: FrozenSet[str]
+    priority: int
+
+# Result lists longer than this are sent as one content block per entry
+_RESULT_CHUNK_THRESHOLD = 50
+
+def _result_chunks(result: Dict[str, Any]) -> List[str]:
+    """
+    Text blocks for a tool result: a single JSON document, or for long result
+    lists an envelope followed by one JSON document per entry
+    """
+    entries = result.get("results")
+    if not isinstance(entries, list) or len(entries) <= _RESULT_CHUNK_THRESHOLD:
+        return [_dumps_result(result)]
+    
+    envelope = {key: value for key, value in result.items() if key != "results"}
+    envelope["results_in_following_blocks"] = len(entries)
+    return [_dumps_result(envelope), *(_dumps_result(entry) for entry in entries)]
+
+def _compile_validator(schema: Dict[str, Any]) -> Callable[[Any], Optional[str]]:
+    """Validator for a tool input schema; returns an error message, or None when valid"""
+    if fastjsonschema is not None:
+        validate = fastjsonschema.compile(schema)
+        
+        def check(arguments: Any) -> Optional[str]:
+            try:
+                validate(arguments)
+            except fastjsonschema.JsonSchemaException as e:
+                return e.message
+            return None
+        return check
+    
+    required = tuple(schema.get("required", ()))
+    
+    def check(arguments: Any) -> Optional[str]:
+        if not isinstance(arguments, dict):
+            return "arguments must be an object"
+        missing = [key for key in required if key not in arguments]
+        if missing:
+            return f"missing required arguments: {', '.join(missing)}"
+        return None
+    return check
+
+# Side-effect free tools whose results may be served from the read cache
+_CACHED_READ_TOOLS = frozenset({"list_agents", "get_swarm_status"})
+
 # MCP imports (these would be from the MCP SDK when available)
 try:
     from mcp.server import Server
     from mcp.server.models import InitializationOptions
     from mcp.server.stdio import stdio_server
-    from mcp.types import (
-        Resource, 
-        Tool, 
-        TextContent, 
-        ImageContent, 
-        EmbeddedResource, 
-        CallToolRequest, 
-        CallToolResult,
-        ListResourcesResult,
-        ListToolsResult,
-        ReadResourceResult,
-    )
+    from mcp.types import Tool, TextContent, CallToolResult
     MCP_AVAILABLE = True
 except ImportError:
     # Fallback for systems without MCP
@@ -53,6 +142,20 @@ class SwarmHiveMCPServer:
         self.server = None
         self.active_swarms = {}
         self.active_hive_sessions = {}
+        self._initialized_nodes = set()  # Agents with a hive node created by this server
+        
+        # Task ids: the server start time keeps them distinct across restarts, the counter
+        # keeps them unique even for several requests within the same second
+        self._task_seq = itertools.count(1)
+        self._task_epoch = int(time.time())
+        
+        # list_agents filter indices, rebuilt when the agent registry generation changes
+        self._index_generation = -1
+        self._agent_order: Dict[str, int] = {}  # agent id -> registry position
+        self._agent_snapshots: Dict[str, AgentSnapshot] = {}
+        self._by_tier: Dict[str, set] = {}
+        self._by_cap: Dict[str, set] = {}
+        self._without_caps: set = set()  # Agents without capabilities pass capability filters
         
         # Initialize logging
         logging.basicConfig(
@@ -60,6 +163,27 @@ class SwarmHiveMCPServer:
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
         self.logger = logging.getLogger(__name__)
+        
+        # Input validators compile once from the static tool schema
+        self._validators = {tool["name"]: _compile_validator(tool["inputSchema"]) for tool in self._build_tools()}
+        
+        self._dispatch = {
+            "swarm_create": self._handle_swarm_create,
+            "swarm_coordinate": self._handle_swarm_coordinate,
+            "hive_decide": self._handle_hive_decide,
+            "hive_remember": self._handle_hive_remember,
+            "hive_recall": self._handle_hive_recall,
+            "collaborate": self._handle_collaborate,
+            "get_swarm_status": self._handle_get_swarm_status,
+            "list_agents": self._handle_list_agents,
+            "batch_execute": self._handle_batch_execute,
+        }
+        
+        # Read tool results keyed on (tool, write version, canonical arguments). Entries
+        # hold the task computing the result so identical concurrent calls share it.
+        self.read_cache_ttl = 2.0
+        self._read_cache: Dict[tuple, tuple] = {}  # key -> (started_at, task)
+        self._write_version = 0
     
     async def initialize(self):
         """Initialize the swarm-hive coordinator"""
@@ -68,12 +192,17 @@ class SwarmHiveMCPServer:
             self.agent_manager = AgentManager(swarm_hive_coordinator=self.coordinator)
             self.logger.info("Swarm-Hive MCP Server initialized successfully")
         except Exception as e:
-            self.logger.error(f"Failed to initialize coordinator: {e}")
+            self.logger.error("Failed to initialize coordinator: %s", e)
             raise
     
     def get_tools(self) -> List[Dict[str, Any]]:
-        """Return available MCP tools"""
-        return [
+        """Return available MCP tools (freshly built, so callers may modify them)"""
+        return self._build_tools()
+    
+    @staticmethod
+    def _build_tools() -> List[Dict[str, Any]]:
+        """Build the MCP tool definitions"""
+        tools = [
             {
                 "name": "swarm_create",
                 "description": "Create a new agent swarm with specified topology and agents",
@@ -188,6 +317,10 @@ class SwarmHiveMCPServer:
                             "minimum": 0,
                             "maximum": 1,
                             "description": "Confidence level (0-1)"
+                        },
+                        "echo_preview": {
+                            "type": "boolean",
+                            "description": "Include a preview of the stored content in the response"
                         }
                     },
                     "required": ["content", "contributors"]
@@ -268,7 +401,7 @@ class SwarmHiveMCPServer:
                         },
                         "detailed": {
                             "type": "boolean",
-                            "description": "Return detailed status"
+                            "description": "Include coordination and hive status, not just the active swarm ids"
                         }
                     }
                 }
@@ -290,53 +423,104 @@ class SwarmHiveMCPServer:
                         }
                     }
                 }
+            },
+            {
+                "name": "batch_execute",
+                "description": "Run several tool calls in one request and return all their results",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "operations": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "name": {"type": "string"},
+                                    "arguments": {"type": "object"}
+                                },
+                                "required": ["name"]
+                            },
+                            "description": "Tool calls to run, results are returned in the same order"
+                        },
+                        "maxConcurrent": {
+                            "type": "number",
+                            "minimum": 1,
+                            "description": "How many operations may run at once (default 1, in order)"
+                        },
+                        "stopOnError": {
+                            "type": "boolean",
+                            "description": "Skip operations not yet started once one fails"
+                        }
+                    },
+                    "required": ["operations"]
+                }
             }
         ]
+        
+        # Every tool accepts the verbose flag
+        for tool in tools:
+            tool["inputSchema"]["properties"]["verbose"] = {
+                "type": "boolean",
+                "description": "Include a human-readable message in the response"
+            }
+        
+        return tools
     
     async def handle_tool_call(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Handle MCP tool calls"""
+        handler = self._dispatch.get(name)
+        if handler is None:
+            return {"error": f"Unknown tool: {name}"}
+        
+        if arguments is None:
+            arguments = {}
+        invalid = self._validators[name](arguments)
+        if invalid is not None:
+            return {"error": f"Invalid arguments for {name}: {invalid}"}
+        
         try:
-            if name == "swarm_create":
-                return await self._handle_swarm_create(arguments)
-            elif name == "swarm_coordinate":
-                return await self._handle_swarm_coordinate(arguments)
-            elif name == "hive_decide":
-                return await self._handle_hive_decide(arguments)
-            elif name == "hive_remember":
-                return await self._handle_hive_remember(arguments)
-            elif name == "hive_recall":
-                return await self._handle_hive_recall(arguments)
-            elif name == "collaborate":
-                return await self._handle_collaborate(arguments)
-            elif name == "get_swarm_status":
-                return await self._handle_get_swarm_status(arguments)
-            elif name == "list_agents":
-                return await self._handle_list_agents(arguments)
-            else:
-                return {"error": f"Unknown tool: {name}"}
-                
+            if name in _CACHED_READ_TOOLS:
+                return await self._cached_read(name, handler, arguments)
+            try:
+                return await handler(arguments)
+            finally:
+                # Any other tool may change what the read tools report
+                self._write_version += 1
+                self._read_cache.clear()
         except Exception as e:
-            self.logger.error(f"Tool call error ({name}): {e}")
+            self.logger.error("Tool call error (%s): %s", name, e)
             return {"error": f"Tool execution failed: {str(e)}"}
     
+    async def _cached_read(self, name: str, handler, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Serve a read tool from the cache, computing it at most once per key and TTL"""
+        key = (name, self._write_version, json.dumps(arguments, sort_keys=True, default=str))
+        now = time.monotonic()
+        entry = self._read_cache.get(key)
+        
+        if entry is None or (entry[1].done() and now - entry[0] >= self.read_cache_ttl):
+            task = asyncio.ensure_future(handler(arguments))
+            task.add_done_callback(functools.partial(self._drop_failed_read, key))
+            entry = self._read_cache[key] = (now, task)
+        
+        # Shielded so one caller going away does not cancel the shared computation
+        return await asyncio.shield(entry[1])
+    
+    def _drop_failed_read(self, key: tuple, task: asyncio.Future):
+        """Keep errors out of the read cache"""
+        if task.cancelled() or task.exception() is not None or task.result().get("error"):
+            entry = self._read_cache.get(key)
+            if entry is not None and entry[1] is task:
+                del self._read_cache[key]
+    
     async def _handle_swarm_create(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Handle swarm creation"""
-        from core.coordination.swarm_manager import SwarmTopology
-        
         swarm_id = args["swarm_id"]
         topology_str = args.get("topology", "adaptive")
         agents = args["agents"]
         task_description = args.get("task_description", "")
         
         # Map topology string to enum
-        topology_map = {
-            "hierarchical": SwarmTopology.HIERARCHICAL,
-            "mesh": SwarmTopology.MESH,
-            "collective": SwarmTopology.COLLECTIVE,
-            "adaptive": SwarmTopology.ADAPTIVE
-        }
-        
-        topology = topology_map.get(topology_str, SwarmTopology.ADAPTIVE)
+        topology = _TOPOLOGY_MAP.get(topology_str, SwarmTopology.ADAPTIVE)
         
         # Create swarm
         swarm = await self.coordinator.swarm_manager.create_swarm(
@@ -348,13 +532,17 @@ class SwarmHiveMCPServer:
         
         self.active_swarms[swarm_id] = swarm
         
-        return {
+        response = {
             "success": True,
             "swarm_id": swarm_id,
             "topology": topology_str,
-            "agents": len(agents),
-            "message": f"Swarm '{swarm_id}' created with {len(agents)} agents using {topology_str} topology"
+            "agents": len(agents)
         }
+        
+        if args.get("verbose", False):
+            response["message"] = f"Swarm '{swarm_id}' created with {len(agents)} agents using {topology_str} topology"
+        
+        return response
     
     async def _handle_swarm_coordinate(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Handle swarm task coordination"""
@@ -376,13 +564,17 @@ class SwarmHiveMCPServer:
         
         result = await self.coordinator.swarm_manager.coordinate_swarm_task(swarm_id, task)
         
-        return {
+        response = {
             "success": True,
             "swarm_id": swarm_id,
             "task": task_description,
-            "coordination_result": result,
-            "message": f"Swarm coordination completed for: {task_description}"
+            "coordination_result": result
         }
+        
+        if args.get("verbose", False):
+            response["message"] = f"Swarm coordination completed for: {task_description}"
+        
+        return response
     
     async def _handle_hive_decide(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Handle hive collective decision"""
@@ -392,12 +584,19 @@ class SwarmHiveMCPServer:
         method = args.get("method", "consensus")
         timeout = args.get("timeout", 300)
         
-        # Initialize hive nodes for agents
-        for agent_id in agents:
-            if agent_id in self.agent_manager.agent_registry:
-                agent_config = self.agent_manager.agent_registry[agent_id]
-                capabilities = agent_config.capabilities.specialization_domains if agent_config.capabilities else []
-                await self.coordinator.hive_intelligence.initialize_hive_node(agent_id, capabilities)
+        # Initialize hive nodes for agents that do not have one yet, concurrently
+        self._refresh_agent_index()
+        snapshots = self._agent_snapshots
+        pending = [
+            agent_id for agent_id in dict.fromkeys(agents)
+            if agent_id in snapshots and agent_id not in self._initialized_nodes
+        ]
+        if pending:
+            hive = self.coordinator.hive_intelligence
+            async with asyncio.TaskGroup() as tg:
+                for agent_id in pending:
+                    tg.create_task(hive.initialize_hive_node(agent_id, list(snapshots[agent_id].caps_list)))
+            self._initialized_nodes.update(pending)
         
         # Create decision options
         decision_options = []
@@ -409,15 +608,7 @@ class SwarmHiveMCPServer:
             })
         
         # Map method string to enum
-        from core.coordination.hive_intelligence import HiveDecisionMethod
-        method_map = {
-            "consensus": HiveDecisionMethod.CONSENSUS,
-            "weighted_voting": HiveDecisionMethod.WEIGHTED_VOTING,
-            "quorum": HiveDecisionMethod.QUORUM,
-            "emergent": HiveDecisionMethod.EMERGENT
-        }
-        
-        decision_method = method_map.get(method, HiveDecisionMethod.CONSENSUS)
+        decision_method = _HIVE_METHOD_MAP.get(method, HiveDecisionMethod.CONSENSUS)
         
         # Initiate decision
         decision_id = await self.coordinator.hive_intelligence.initiate_hive_decision(
@@ -427,15 +618,19 @@ class SwarmHiveMCPServer:
             timeout_seconds=timeout
         )
         
-        return {
+        response = {
             "success": True,
             "decision_id": decision_id,
             "question": question,
             "options": options,
             "method": method,
-            "agents": agents,
-            "message": f"Hive decision initiated: {question}"
+            "agents": agents
         }
+        
+        if args.get("verbose", False):
+            response["message"] = f"Hive decision initiated: {question}"
+        
+        return response
     
     async def _handle_hive_remember(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Handle storing information in collective memory"""
@@ -445,15 +640,7 @@ class SwarmHiveMCPServer:
         confidence = args.get("confidence", 0.8)
         
         # Map memory type string to enum
-        from core.coordination.hive_intelligence import HiveMemoryType
-        type_map = {
-            "working": HiveMemoryType.WORKING,
-            "episodic": HiveMemoryType.EPISODIC,
-            "semantic": HiveMemoryType.SEMANTIC,
-            "collective": HiveMemoryType.COLLECTIVE
-        }
-        
-        mem_type = type_map.get(memory_type, HiveMemoryType.SEMANTIC)
+        mem_type = _MEMORY_TYPE_MAP.get(memory_type, HiveMemoryType.SEMANTIC)
         
         # Store memory
         memory_id = await self.coordinator.hive_intelligence.store_collective_memory(
@@ -463,14 +650,22 @@ class SwarmHiveMCPServer:
             confidence
         )
         
-        return {
+        response = {
             "success": True,
             "memory_id": memory_id,
-            "content": content[:100] + "..." if len(content) > 100 else content,
+            "content_length": len(content),
             "memory_type": memory_type,
-            "contributors": contributors,
-            "message": f"Information stored in {memory_type} memory"
+            "contributors": contributors
         }
+        
+        if args.get("verbose", False):
+            response["message"] = f"Information stored in {memory_type} memory"
+        
+        # The caller already has the content; only echo it back on request
+        if args.get("echo_preview", False):
+            response["content"] = content[:100] + "..." if len(content) > 100 else content
+        
+        return response
     
     async def _handle_hive_recall(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Handle recalling information from collective memory"""
@@ -482,41 +677,40 @@ class SwarmHiveMCPServer:
         # Map memory type if specified
         mem_type = None
         if memory_type:
-            from core.coordination.hive_intelligence import HiveMemoryType
-            type_map = {
-                "working": HiveMemoryType.WORKING,
-                "episodic": HiveMemoryType.EPISODIC,
-                "semantic": HiveMemoryType.SEMANTIC,
-                "collective": HiveMemoryType.COLLECTIVE
-            }
-            mem_type = type_map.get(memory_type)
+            mem_type = _MEMORY_TYPE_MAP.get(memory_type)
         
-        # Recall memories
+        # Recall memories, bounded by the coordinator
         memories = await self.coordinator.hive_intelligence.recall_collective_memory(
             query,
             mem_type,
-            min_confidence
+            min_confidence,
+            limit=int(limit)
         )
         
-        # Format results
-        results = []
-        for memory in memories[:limit]:
-            results.append({
+        # Format results; contributors are stored as sets, which JSON needs as lists
+        results = [
+            {
                 "fragment_id": memory.fragment_id,
-                "content": str(memory.content),
+                "content": memory.content if type(memory.content) is str else str(memory.content),
                 "confidence": memory.confidence_score,
                 "type": memory.memory_type.value,
                 "contributors": list(memory.contributors),
                 "access_count": memory.access_count
-            })
+            }
+            for memory in memories
+        ]
         
-        return {
+        response = {
             "success": True,
             "query": query,
             "memories_found": len(results),
-            "results": results,
-            "message": f"Found {len(results)} relevant memories for: {query}"
+            "results": results
         }
+        
+        if args.get("verbose", False):
+            response["message"] = f"Found {len(results)} relevant memories for: {query}"
+        
+        return response
     
     async def _handle_collaborate(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Handle multi-agent collaboration"""
@@ -528,7 +722,7 @@ class SwarmHiveMCPServer:
         
         # Create coordination task
         coordination_task = CoordinationTask(
-            task_id=f"claude_code_collab_{int(asyncio.get_event_loop().time())}",
+            task_id=f"claude_code_collab_{self._task_epoch}_{next(self._task_seq)}",
             description=task_description,
             complexity=complexity,
             required_capabilities=agents,
@@ -539,16 +733,20 @@ class SwarmHiveMCPServer:
         # Execute coordination
         result = await self.coordinator.coordinate_task(coordination_task, agents)
         
-        return {
+        response = {
             "success": True,
             "task": task_description,
             "agents": agents,
             "mode_used": result.get("coordination_mode", coordination_mode),
             "duration": result.get("duration", 0),
             "efficiency": result.get("result", {}).get("efficiency_score", 0),
-            "result": result.get("result", {}),
-            "message": f"Collaboration completed: {task_description}"
+            "result": result.get("result", {})
         }
+        
+        if args.get("verbose", False):
+            response["message"] = f"Collaboration completed: {task_description}"
+        
+        return response
     
     async def _handle_get_swarm_status(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Handle getting swarm status"""
@@ -566,46 +764,101 @@ class SwarmHiveMCPServer:
                 }
             else:
                 return {"error": f"Swarm '{swarm_id}' not found"}
+        elif not detailed:
+            # Summary only; the coordinator and hive snapshots are built on request
+            active_swarms = list(self.active_swarms)
+            response = {
+                "success": True,
+                "active_swarms": active_swarms,
+                "count": len(active_swarms)
+            }
+            
+            if args.get("verbose", False):
+                response["message"] = "Swarm summary retrieved"
+            
+            return response
         else:
             # Get all swarms status
             all_status = self.coordinator.get_coordination_status()
             hive_status = self.coordinator.hive_intelligence.get_hive_status()
             
-            return {
+            response = {
                 "success": True,
                 "coordination_status": all_status,
                 "hive_status": hive_status,
-                "active_swarms": list(self.active_swarms.keys()),
-                "message": "System status retrieved"
+                "active_swarms": list(self.active_swarms.keys())
             }
+            
+            if args.get("verbose", False):
+                response["message"] = "System status retrieved"
+            
+            return response
+    
+    def _refresh_agent_index(self):
+        """Rebuild the agent snapshots and filter indices if the agent registry changed"""
+        generation = self.agent_manager.registry_generation
+        if generation == self._index_generation:
+            return
+        
+        order: Dict[str, int] = {}
+        snapshots: Dict[str, AgentSnapshot] = {}
+        by_tier: Dict[str, set] = {}
+        by_cap: Dict[str, set] = {}
+        without_caps = set()
+        for position, (agent_id, config) in enumerate(self.agent_manager.get_agent_registry().items()):
+            caps = tuple(config.capabilities.specialization_domains) if config.capabilities else ()
+            snapshot = snapshots[agent_id] = AgentSnapshot(
+                id=agent_id,
+                name=config.name,
+                tier=config.tier.value,
+                caps_list=caps,
+                caps_set=frozenset(caps),
+                priority=config.coordination_priority
+            )
+            order[agent_id] = position
+            by_tier.setdefault(snapshot.tier, set()).add(agent_id)
+            if config.capabilities:
+                for domain in snapshot.caps_set:
+                    by_cap.setdefault(domain, set()).add(agent_id)
+            else:
+                without_caps.add(agent_id)
+        
+        self._agent_order = order
+        self._agent_snapshots = snapshots
+        self._by_tier = by_tier
+        self._by_cap = by_cap
+        self._without_caps = without_caps
+        self._index_generation = generation
     
     async def _handle_list_agents(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Handle listing available agents"""
         category = args.get("category")
         capabilities = args.get("capabilities", [])
         
-        # Get agents from registry
-        registry = self.agent_manager.get_agent_registry()
+        # Narrow candidates through the indices instead of scanning the registry
+        self._refresh_agent_index()
+        if category:
+            candidates = set(self._by_tier.get(category, ()))
+        else:
+            candidates = set(self._agent_order)
+        
+        if capabilities:
+            matching = set(self._without_caps)
+            for capability in capabilities:
+                matching.update(self._by_cap.get(capability, ()))
+            candidates &= matching
+        
+        snapshots = self._agent_snapshots
         agents = []
         
-        for agent_id, config in registry.items():
-            # Filter by category if specified
-            if category and config.tier.value != category:
-                continue
-            
-            # Filter by capabilities if specified
-            if capabilities and config.capabilities:
-                agent_caps = set(config.capabilities.specialization_domains)
-                required_caps = set(capabilities)
-                if not agent_caps.intersection(required_caps):
-                    continue
-            
+        for agent_id in sorted(candidates, key=self._agent_order.__getitem__):
+            snapshot = snapshots[agent_id]
             agents.append({
                 "id": agent_id,
-                "name": config.name,
-                "tier": config.tier.value,
-                "capabilities": config.capabilities.specialization_domains if config.capabilities else [],
-                "priority": config.coordination_priority
+                "name": snapshot.name,
+                "tier": snapshot.tier,
+                "capabilities": snapshot.caps_list,
+                "priority": snapshot.priority
             })
         
         return {
@@ -616,6 +869,44 @@ class SwarmHiveMCPServer:
             "filtered_by_capabilities": capabilities
         }
 
+    async def _handle_batch_execute(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle running several tool calls in one request"""
+        operations = args["operations"]
+        max_concurrent = max(1, int(args.get("maxConcurrent", 1)))
+        stop_on_error = args.get("stopOnError", False)
+        
+        semaphore = asyncio.Semaphore(max_concurrent)
+        failed = False
+        
+        async def run(operation: Dict[str, Any]) -> Dict[str, Any]:
+            nonlocal failed
+            async with semaphore:
+                name = operation.get("name")
+                if stop_on_error and failed:
+                    return {"error": f"Skipped {name} after an earlier failure"}
+                if name == "batch_execute":
+                    result = {"error": "batch_execute cannot be nested"}
+                else:
+                    result = await self.handle_tool_call(name, operation.get("arguments") or {})
+                if result.get("error"):
+                    failed = True
+                return result
+        
+        results = await asyncio.gather(*(run(operation) for operation in operations))
+        failures = sum(1 for result in results if result.get("error"))
+        
+        response = {
+            "success": failures == 0,
+            "results": results,
+            "total": len(results),
+            "failed": failures
+        }
+        
+        if args.get("verbose", False):
+            response["message"] = f"Batch completed: {len(results) - failures}/{len(results)} operations succeeded"
+        
+        return response
+
 # MCP Server setup (if MCP is available)
 if MCP_AVAILABLE:
     async def run_mcp_server():
@@ -625,10 +916,12 @@ if MCP_AVAILABLE:
         
         server = Server("swarm-hive-mcp")
         
+        # Validated once, from plain dicts; every tools/list request returns the same models
+        mcp_tools = [Tool(**tool) for tool in SwarmHiveMCPServer._build_tools()]
+        
         @server.list_tools()
         async def list_tools() -> List[Tool]:
-            tools = swarm_hive_server.get_tools()
-            return [Tool(**tool) for tool in tools]
+            return mcp_tools
         
         @server.call_tool()
         async def call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
@@ -640,10 +933,7 @@ if MCP_AVAILABLE:
                 )
             else:
                 return CallToolResult(
-                    content=[TextContent(
-                        type="text", 
-                        text=json.dumps(result, indent=2)
-                    )]
+                    content=[TextContent(type="text", text=text) for text in _result_chunks(result)]
                 )
         
         # Run server
@@ -674,14 +964,29 @@ async def run_standalone_server():
     
     print("\nServer ready for Claude Code integration...")
     
-    # Keep server running
+    # Keep server running until a shutdown signal, without periodic wakeups
+    shutdown = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, shutdown.set)
+        except (NotImplementedError, RuntimeError):
+            pass  # No loop signal handlers here (e.g. Windows); Ctrl+C still interrupts
+    
     try:
-        while True:
-            await asyncio.sleep(1)
+        await shutdown.wait()
     except KeyboardInterrupt:
-        print("\nShutting down...")
+        pass
+    print("\nShutting down...")
 
 if __name__ == "__main__":
+    # Prefer uvloop's libuv-based event loop for the stdio transport when available
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     if MCP_AVAILABLE:
         asyncio.run(run_mcp_server())
     else:
@@ -94,8 +94,14 @@ flake8>=6.0.0
 # Optional: CrewAI for multi-agent systems
 crewai>=0.1.0
 
-# Optional: MCP server support
+# Optional: MCP server support and tool argument validation
 mcp>=0.1.0
+fastjsonschema>=2.18.0
+
+# Optional: fast JSON, params validation and event loop for the daemon bridge socket
+orjson>=3.9.0
+uvloop>=0.19.0; sys_platform != "win32"
+msgspec>=0.18.0
 EOF
     print_success "Requirements file created"
 fi
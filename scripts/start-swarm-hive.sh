@@ -101,18 +101,29 @@ test_connection() {
     if python3 -c "
 import socket
 import json
+import struct
 import sys
 
+def recv_exactly(sock, size):
+    data = b''
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError('bridge closed the connection')
+        data += chunk
+    return data
+
 try:
     sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
     sock.connect('$PYTHON_SOCKET')
     
-    # Test hive status command
+    # Test hive status command, framed as <uint32 big-endian length><JSON payload>
     command = {'action': 'hive_status', 'params': {}}
-    sock.send((json.dumps(command) + '\n').encode())
+    body = json.dumps(command).encode()
+    sock.sendall(struct.pack('>I', len(body)) + body)
     
-    response = sock.recv(1024).decode().strip()
-    result = json.loads(response)
+    (length,) = struct.unpack('>I', recv_exactly(sock, 4))
+    result = json.loads(recv_exactly(sock, length))
     
     if result.get('success'):
         print('✅ Hive intelligence operational')
@@ -5,7 +5,7 @@ use std::collections::HashMap;
 use std::sync::Arc;
 use tokio::net::{UnixListener, UnixStream};
 use tokio::sync::{Mutex, RwLock};
-use tokio::io::{AsyncReadExt, AsyncWriteExt};
+use tokio::io::{AsyncReadExt, AsyncWriteExt, BufReader};
 use serde::{Deserialize, Serialize};
 use serde_json;
 use tracing::{info, warn, error, debug};
@@ -209,6 +209,9 @@ pub struct PythonBridge {
     socket_path: String,
 }
 
+// Largest response frame accepted from the Python bridge, matching its own limit
+const MAX_FRAME_SIZE: usize = 16 * 1024 * 1024;
+
 impl PythonBridge {
     pub fn new(socket_path: String) -> Self {
         Self { socket_path }
@@ -218,29 +221,26 @@ impl PythonBridge {
         // Connect to Python daemon bridge
         match UnixStream::connect(&self.socket_path).await {
             Ok(mut stream) => {
-                // Send command
-                let command_str = serde_json::to_string(&command)?;
-                stream.write_all((command_str + "\n").as_bytes()).await?;
-                
-                // Read response
-                let mut buffer = Vec::new();
-                let mut temp_buffer = [0u8; 1024];
+                // Send command as <u32 big-endian length><JSON payload>
+                let payload = serde_json::to_vec(&command)?;
+                let mut frame = Vec::with_capacity(4 + payload.len());
+                frame.extend_from_slice(&(payload.len() as u32).to_be_bytes());
+                frame.extend_from_slice(&payload);
+                stream.write_all(&frame).await?;
                 
-                loop {
-                    match stream.read(&mut temp_buffer).await {
-                        Ok(0) => break, // Connection closed
-                        Ok(n) => {
-                            buffer.extend_from_slice(&temp_buffer[..n]);
-                            if buffer.ends_with(b"\n") {
-                                break;
-                            }
-                        }
-                        Err(e) => return Err(e.into()),
-                    }
+                // Read length-prefixed response; buffered so a typical reply
+                // (header and body) arrives in one read instead of two
+                let mut reader = BufReader::with_capacity(64 * 1024, stream);
+                let mut header = [0u8; 4];
+                reader.read_exact(&mut header).await?;
+                let length = u32::from_be_bytes(header) as usize;
+                if length > MAX_FRAME_SIZE {
+                    anyhow::bail!("Python bridge frame of {} bytes exceeds {} byte limit", length, MAX_FRAME_SIZE);
                 }
+                let mut buffer = vec![0u8; length];
+                reader.read_exact(&mut buffer).await?;
                 
-                let response_str = String::from_utf8_lossy(&buffer);
-                let response: serde_json::Value = serde_json::from_str(response_str.trim())?;
+                let response: serde_json::Value = serde_json::from_slice(&buffer)?;
                 Ok(response)
             }
             Err(e) => {
@@ -408,7 +408,7 @@ impl AgentDaemon {
             // Swarm-Hive commands - delegate to Python bridge
             "swarm_create" | "swarm_execute" | "swarm_status" | "swarm_dissolve" | "swarm_list" |
             "hive_init" | "hive_decide" | "hive_remember" | "hive_recall" | "hive_status" |
-            "collaborate" => {
+            "collaborate" | "task_status" => {
                 if let Some(bridge) = python_bridge {
                     let python_command = serde_json::json!({
                         "action": command.action,
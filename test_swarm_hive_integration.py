@@ -2,27 +2,62 @@
 """
 Test suite for Swarm-Hive Integration in AgentNativeFramework
 Demonstrates the full swarm intelligence and hive mind capabilities
+
+Run as a script for the full report, or under pytest with pytest-asyncio
+installed (`pytest test_swarm_hive_integration.py`, adding `-n auto` with
+pytest-xdist) where each suite builds its own manager and coordinator.
 """
 
 import asyncio
+import importlib.util
+import io
 import json
+import struct
+import sys
+import tempfile
+from operator import attrgetter
 import time
-from typing import Dict, List, Any
+from contextvars import ContextVar
+from typing import Dict, List, Any, Optional
 from pathlib import Path
 
+from prometheus_client import REGISTRY
+
 # Import the core components
 from core.agents.agent_manager import AgentManager
 from core.coordination.swarm_manager import SwarmManager, SwarmTopology
 from core.coordination.hive_intelligence import HiveIntelligence, HiveDecisionMethod, HiveMemoryType
 from core.coordination.swarm_hive_coordinator import SwarmHiveCoordinator, CoordinationTask, CoordinationMode
+from core.daemon_bridge import DaemonBridge
+from core.monitoring import health_checks
+from core.monitoring.health_checks import HealthCheck, HealthMonitor, HealthStatus, to_json_bytes
+from core.resilience.error_recovery import AgentError, CircuitBreaker, CircuitBreakerConfig, CircuitState
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback
+    orjson = None
+
+try:
+    import pytest
+    import pytest_asyncio  # noqa: F401
+    pytestmark = pytest.mark.asyncio
+except ImportError:  # script mode only
+    pass
 
-async def test_swarm_functionality():
+async def run_all(coros) -> List[Any]:
+    """Run coroutines in one task group and return their results in order; a failure cancels the rest"""
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(coro) for coro in coros]
+    return [task.result() for task in tasks]
+
+async def test_swarm_functionality(agent_manager=None):
     """Test pure swarm coordination capabilities"""
     print("\n🐛 Testing Swarm Functionality")
     print("=" * 50)
     
     # Initialize components
-    agent_manager = AgentManager()
+    agent_manager = agent_manager or AgentManager.default()
     swarm_manager = SwarmManager(agent_manager)
     
     # Create a hierarchical swarm for iOS development
@@ -35,6 +70,10 @@ async def test_swarm_functionality():
         {"project_type": "ios_ai_app", "complexity": 0.8}
     )
     
+    assert swarm.swarm_id == "ios_dev_swarm"
+    assert swarm.topology is SwarmTopology.HIERARCHICAL
+    assert set(swarm.active_agents) <= set(swarm_agents)
+    
     print(f"✅ Created swarm: {swarm.swarm_id}")
     print(f"   Topology: {swarm.topology.value}")
     print(f"   Agents: {len(swarm.active_agents)}")
@@ -47,9 +86,11 @@ async def test_swarm_functionality():
         "time_critical": False
     }
     
-    start_time = time.time()
+    start = time.perf_counter()
     result = await swarm_manager.coordinate_swarm_task("ios_dev_swarm", task)
-    duration = time.time() - start_time
+    duration = time.perf_counter() - start
+    assert result.get("status") == "completed", result
+    assert result.get("approach") == "hierarchical", result
     
     print(f"✅ Swarm task completed in {duration:.2f}s")
     print(f"   Result: {result.get('status', 'unknown')}")
@@ -57,10 +98,26 @@ async def test_swarm_functionality():
     
     # Get swarm status
     status = swarm_manager.get_swarm_status("ios_dev_swarm")
+    assert status["agent_count"] == len(swarm.active_agents)
+    assert status["uptime"] >= 0
     print(f"📊 Swarm status: {status['agent_count']} agents, health: {status['health_score']}")
     
-    # Clean up
-    await swarm_manager.dissolve_swarm("ios_dev_swarm")
+    # Each caller gets its own status dict, so edits don't leak into the cached snapshot
+    loads = [agent["load"] for agent in status["active_agents"]]
+    status["agent_count"] = -1
+    status.pop("health_score")
+    for agent in status["active_agents"]:
+        agent["load"] = 42
+    status["active_agents"].clear()
+    again = swarm_manager.get_swarm_status("ios_dev_swarm")
+    assert again["agent_count"] == len(swarm.active_agents) and "health_score" in again
+    assert [agent["load"] for agent in again["active_agents"]] == loads
+    
+    # Clean up; the archive entry is written before dissolve returns
+    assert await swarm_manager.dissolve_swarm("ios_dev_swarm")
+    assert swarm_manager.get_swarm_status("ios_dev_swarm") is None
+    assert swarm_manager.swarm_history[-1]["swarm_id"] == "ios_dev_swarm"
+    assert "swarm_ios_dev_swarm_learnings" in swarm_manager.global_memory
     print("🧹 Swarm dissolved\n")
 
 async def test_hive_intelligence():
@@ -78,11 +135,12 @@ async def test_hive_intelligence():
         ("backend_architect", ["backend", "architecture", "systems"])
     ]
     
-    nodes = []
-    for agent_id, capabilities in agents_and_capabilities:
-        node = await hive.initialize_hive_node(agent_id, capabilities)
-        nodes.append(node)
-        print(f"✅ Initialized hive node for {agent_id}")
+    nodes = await run_all(
+        hive.initialize_hive_node(agent_id, capabilities) for agent_id, capabilities in agents_and_capabilities
+    )
+    assert [node.agent_id for node in nodes] == [agent_id for agent_id, _ in agents_and_capabilities]
+    for node in nodes:
+        print(f"✅ Initialized hive node for {node.agent_id}")
     
     # Store collective memory
     memory_content = {
@@ -94,7 +152,7 @@ async def test_hive_intelligence():
     memory_id = await hive.store_collective_memory(
         memory_content,
         HiveMemoryType.SEMANTIC,
-        {node.agent_id for node in nodes},
+        set(map(attrgetter("agent_id"), nodes)),
         confidence=0.9
     )
     
@@ -125,23 +183,40 @@ async def test_hive_intelligence():
     
     print(f"🗳️ Initiated hive decision: {decision_id}")
     
-    # Wait for decision (short wait for demo)
-    await asyncio.sleep(6)
+    # Wait for the decision to resolve, bounded a little past its own timeout
+    decision = await asyncio.wait_for(hive.await_decision(decision_id), timeout=5.5)
+    assert decision.decision_id == decision_id
+    print(f"   Consensus reached: {decision.consensus_reached}")
     
     # Check hive status
     status = hive.get_hive_status()
+    assert status["nodes"] == len(nodes)
+    assert status["memory_fragments"] >= 1
     print(f"📊 Hive status: {status['nodes']} nodes, {status['memory_fragments']} memories")
     print(f"   Collective confidence: {status['collective_confidence']:.2f}")
     print("")
 
-async def test_swarm_hive_hybrid():
+# Coordination results are what MCP and daemon clients receive, so the suite checks they serialize
+if orjson is not None:
+    def dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+else:
+    def dumps(obj: Any) -> str:
+        return json.dumps(obj)
+
+async def timed(coro):
+    """Await a coroutine and return (duration, result)"""
+    start = time.perf_counter()
+    result = await coro
+    return time.perf_counter() - start, result
+
+async def test_swarm_hive_hybrid(coordinator=None):
     """Test integrated swarm-hive coordination"""
     print("\n🚀 Testing Swarm-Hive Hybrid Coordination")
     print("=" * 50)
     
     # Initialize full coordinator
-    agent_manager = AgentManager()
-    coordinator = SwarmHiveCoordinator(agent_manager)
+    coordinator = coordinator or SwarmHiveCoordinator(AgentManager.default())
     
     # Test different coordination modes
     test_tasks = [
@@ -180,40 +255,42 @@ async def test_swarm_hive_hybrid():
         }
     ]
     
-    results = []
-    for test_case in test_tasks:
-        print(f"\n🎯 Testing: {test_case['name']}")
+    # The cases are independent, so their coordination waits overlap
+    timings = await run_all(
+        timed(coordinator.coordinate_task(test_case['task'])) for test_case in test_tasks
+    )
+    
+    # Per-case columns, one list per field
+    names = [test_case['name'] for test_case in test_tasks]
+    durations = [duration for duration, _ in timings]
+    modes = [result.get('coordination_mode', 'unknown') for _, result in timings]
+    efficiencies = [result.get('result', {}).get('efficiency_score', 0) for _, result in timings]
+    
+    for name, test_case, duration, mode, efficiency in zip(names, test_tasks, durations, modes, efficiencies):
+        assert mode == test_case['task'].coordination_mode.value, (name, mode)
+        print(f"\n🎯 Testing: {name}")
         print(f"   Complexity: {test_case['task'].complexity}")
         print(f"   Mode: {test_case['task'].coordination_mode.value}")
-        
-        start_time = time.time()
-        result = await coordinator.coordinate_task(test_case['task'])
-        duration = time.time() - start_time
-        
-        results.append({
-            "test_name": test_case['name'],
-            "duration": duration,
-            "result": result
-        })
-        
         print(f"   ✅ Completed in {duration:.2f}s")
-        print(f"   Mode used: {result.get('coordination_mode', 'unknown')}")
-        print(f"   Efficiency: {result.get('result', {}).get('efficiency_score', 0):.2f}")
+        print(f"   Mode used: {mode}")
+        print(f"   Efficiency: {efficiency:.2f}")
     
     # Summary
     print(f"\n📈 Test Summary:")
-    for result in results:
-        print(f"   {result['test_name']}: {result['duration']:.2f}s")
+    for name, duration in zip(names, durations):
+        print(f"   {name}: {duration:.2f}s")
+    payload = dumps([result for _, result in timings])
+    assert len(json.loads(payload)) == len(test_tasks)
+    print(f"   Serialized results: {len(payload)} bytes")
     
     print("")
 
-async def test_adaptive_coordination():
+async def test_adaptive_coordination(coordinator=None):
     """Test adaptive coordination mode selection"""
     print("\n🔄 Testing Adaptive Coordination")
     print("=" * 50)
     
-    agent_manager = AgentManager()
-    coordinator = SwarmHiveCoordinator(agent_manager)
+    coordinator = coordinator or SwarmHiveCoordinator(AgentManager.default())
     
     # Create adaptive tasks with different characteristics
     adaptive_tasks = [
@@ -243,12 +320,22 @@ async def test_adaptive_coordination():
         )
     ]
     
-    for task in adaptive_tasks:
+    results = await run_all(coordinator.coordinate_task(task) for task in adaptive_tasks)
+    
+    # Simple tasks follow recent swarm/hive efficiency; the other two are fixed by the rules
+    expected_modes = [
+        {"swarm_only", "hive_only"},  # Simple task, low complexity
+        {"swarm_only"},               # Time critical with at most 5 agents
+        {"hive_only"}                 # More than 8 agents
+    ]
+    for task, result, expected in zip(adaptive_tasks, results, expected_modes):
+        assert result.get("coordination_mode") in expected, (task.task_id, result.get("coordination_mode"))
+    
+    for task, result in zip(adaptive_tasks, results):
         print(f"\n🎲 Adaptive task: {task.description}")
         print(f"   Complexity: {task.complexity}, Capabilities: {len(task.required_capabilities)}")
         print(f"   Time critical: {task.time_critical}")
         
-        result = await coordinator.coordinate_task(task)
         selected_mode = result.get("coordination_mode", "unknown")
         
         print(f"   🎯 Selected mode: {selected_mode}")
@@ -256,14 +343,14 @@ async def test_adaptive_coordination():
     
     print("")
 
-async def test_agent_manager_integration():
+async def test_agent_manager_integration(agent_manager=None):
     """Test integration with agent manager"""
     print("\n🔗 Testing Agent Manager Integration")
     print("=" * 50)
     
     # Initialize enhanced agent manager
-    coordinator = SwarmHiveCoordinator()
-    agent_manager = AgentManager(swarm_hive_coordinator=coordinator)
+    if agent_manager is None:
+        agent_manager = AgentManager(swarm_hive_coordinator=SwarmHiveCoordinator())
     
     # Test swarm-hive recommendations
     task_requirements = {
@@ -273,6 +360,7 @@ async def test_agent_manager_integration():
     }
     
     recommendations = agent_manager.get_swarm_hive_recommendations(task_requirements)
+    assert "coordination_mode" in recommendations
     print("🎯 Coordination Recommendations:")
     for key, value in recommendations.items():
         print(f"   {key}: {value}")
@@ -306,75 +394,319 @@ async def test_agent_manager_integration():
     }
     
     enhanced_result = await agent_manager.coordinate_with_swarm_hive(enhanced_task)
+    assert enhanced_result.get("coordination_mode") in {mode.value for mode in CoordinationMode}, enhanced_result
     print(f"\n⚡ Enhanced coordination completed:")
     print(f"   Mode: {enhanced_result.get('coordination_mode', 'unknown')}")
     print(f"   Duration: {enhanced_result.get('duration', 0):.2f}s")
     
     print("")
 
-async def test_system_status_monitoring():
+async def test_system_status_monitoring(coordinator=None):
     """Test system status and monitoring"""
-    print("\n📊 Testing System Status Monitoring")
-    print("=" * 50)
-    
-    coordinator = SwarmHiveCoordinator()
+    coordinator = coordinator or SwarmHiveCoordinator(AgentManager.default())
     
     # Get comprehensive status
     status = coordinator.get_coordination_status()
+    health = status.get('system_health', {})
+    assert status["coordinator"]["active_coordinations"] >= 0
+    assert isinstance(status["swarm_manager"]["active_swarms"], int)
+    assert 0.0 <= status["hive_intelligence"]["collective_confidence"] <= 1.0
+    
+    # Snapshots are shared only within the status TTL; callers must not see each other's edits
+    scratch = coordinator.get_coordination_status()
+    active = scratch["coordinator"]["active_coordinations"]
+    scratch["coordinator"]["active_coordinations"] = 999
+    scratch["system_health"]["swarm_efficiency"] = -1.0
+    scratch["coordinator"] = None
+    fresh = coordinator.get_coordination_status()
+    assert fresh["coordinator"]["active_coordinations"] == active
+    assert fresh["system_health"]["swarm_efficiency"] != -1.0
+    
+    # The report is written in one go
+    out = [
+        "\n📊 Testing System Status Monitoring",
+        "=" * 50,
+        "🎛️ System Status:",
+        f"   Active coordinations: {status['coordinator']['active_coordinations']}",
+        f"   Coordination history: {status['coordinator']['coordination_history']}",
+        f"   Active swarms: {status['swarm_manager']['active_swarms']}",
+        f"   Hive nodes: {status['hive_intelligence']['nodes']}",
+        f"   Memory fragments: {status['hive_intelligence']['memory_fragments']}",
+        f"   Collective confidence: {status['hive_intelligence']['collective_confidence']:.2f}",
+        "\n🏥 System Health:"
+    ]
+    out.extend(f"   {metric}: {value:.2f}" for metric, value in health.items())
+    out.append("\n")
+    sys.stdout.write("\n".join(out))
+
+def _frame(body: bytes) -> bytes:
+    """Length-prefixed bridge frame"""
+    return struct.pack(">I", len(body)) + body
+
+async def _read_frame(reader: asyncio.StreamReader) -> Dict[str, Any]:
+    (length,) = struct.unpack(">I", await reader.readexactly(4))
+    return json.loads(await reader.readexactly(length))
+
+async def test_daemon_bridge_framing():
+    """Test the daemon bridge wire protocol: framing, pipelining and malformed payloads"""
+    print("\n🔌 Testing Daemon Bridge Framing")
+    print("=" * 50)
     
-    print("🎛️ System Status:")
-    print(f"   Active coordinations: {status['coordinator']['active_coordinations']}")
-    print(f"   Coordination history: {status['coordinator']['coordination_history']}")
-    print(f"   Active swarms: {status['swarm_manager']['active_swarms']}")
-    print(f"   Hive nodes: {status['hive_intelligence']['nodes']}")
-    print(f"   Memory fragments: {status['hive_intelligence']['memory_fragments']}")
-    print(f"   Collective confidence: {status['hive_intelligence']['collective_confidence']:.2f}")
+    with tempfile.TemporaryDirectory() as socket_dir:
+        bridge = DaemonBridge(str(Path(socket_dir) / "bridge.sock"))
+        server = asyncio.create_task(bridge.start())
+        try:
+            while not Path(bridge.socket_path).exists():
+                await asyncio.sleep(0.01)
+            reader, writer = await asyncio.open_unix_connection(bridge.socket_path)
+            
+            # Pipelined frames, with the header and body of the first split across writes
+            first = _frame(json.dumps({"action": "swarm_list", "params": {}}).encode())
+            writer.write(first[:2])
+            await writer.drain()
+            writer.write(
+                first[2:]
+                + _frame(b"\xff\xfe not utf-8")
+                + _frame(b"[1, 2]")
+                + _frame(json.dumps({"action": "no_such_action"}).encode())
+            )
+            await writer.drain()
+            
+            replies = [await _read_frame(reader) for _ in range(4)]
+            assert replies[0] == {"success": True, "swarms": [], "total": 0}, replies[0]
+            assert replies[1] == {"error": "Invalid JSON command"}, replies[1]
+            assert replies[2] == {"error": "Invalid JSON command"}, replies[2]
+            assert replies[3]["error"].startswith("Unknown action"), replies[3]
+            print(f"✅ {len(replies)} pipelined replies in order, malformed frames answered")
+            
+            # The connection survives malformed frames
+            writer.write(first)
+            await writer.drain()
+            assert (await _read_frame(reader))["success"] is True
+            print("✅ Connection still usable after malformed frames")
+            
+            writer.close()
+            await writer.wait_closed()
+        finally:
+            server.cancel()
+            try:
+                await server
+            except asyncio.CancelledError:
+                pass
+    print("")
+
+async def test_health_status_reporting():
+    """Test health status values and worst-status aggregation"""
+    print("\n🏥 Testing Health Status Reporting")
+    print("=" * 50)
     
-    print("\n🏥 System Health:")
-    health = status.get('system_health', {})
-    for metric, value in health.items():
-        print(f"   {metric}: {value:.2f}")
+    # Status values stay the lowercase strings report consumers parse
+    assert [status.value for status in HealthStatus] == ["healthy", "degraded", "unhealthy", "critical"]
+    assert HealthStatus("critical") is HealthStatus.CRITICAL
+    
+    # Core checks stubbed with fixed results; the report takes the worst of them
+    def stub(name, status):
+        async def check():
+            return HealthCheck(name, status, f"{name} stubbed", time.time(), 0.0)
+        return check
+    
+    monitor = HealthMonitor()
+    monitor._check_system_resources = stub("system_resources", HealthStatus.HEALTHY)
+    monitor._check_agent_manager = stub("agent_manager", HealthStatus.UNHEALTHY)
+    monitor._check_memory_usage = stub("memory_usage", HealthStatus.DEGRADED)
+    monitor._check_coordination_health = stub("coordination_health", HealthStatus.HEALTHY)
+    
+    report = await monitor.perform_full_health_check(force=True)
+    summary = report["summary"]
+    assert report["status"] == "unhealthy", report["status"]
+    assert summary["failed_checks"] == ["agent_manager"]
+    assert summary["degraded_checks"] == ["memory_usage"]
+    assert summary["status_distribution"] == {"healthy": 2, "degraded": 1, "unhealthy": 1}
+    print(f"✅ Worst of {summary['total_checks']} checks: {report['status']}")
+    
+    # Without an agent manager or a fresh report the service is not ready
+    readiness = await monitor.get_readiness_probe()
+    assert readiness["ready"] is False, readiness
+    print(f"✅ Readiness without agent manager: {readiness['message']}")
+    
+    # Every report handed out is a copy; edits never reach the cached report
+    monitor = HealthMonitor(AgentManager.default())
+    report = await monitor.perform_full_health_check(force=True)
+    status, check_count = report["status"], len(report["checks"])
+    report["status"] = "edited"
+    report["checks"][0]["metadata"]["edited"] = True
+    report["summary"]["failed_checks"].append("edited")
+    cached = await monitor.perform_full_health_check()
+    assert cached["cached"] is True and cached["status"] == status
+    assert "edited" not in cached["checks"][0]["metadata"]
+    assert "edited" not in cached["summary"]["failed_checks"]
+    cached["checks"].clear()
+    assert len((await monitor.perform_full_health_check())["checks"]) == check_count
+    print(f"✅ Cached report unaffected by caller edits ({check_count} checks)")
+    
+    # The HTTP body round-trips through both the orjson path and the stdlib fallback
+    report = await monitor.perform_full_health_check(force=True)
+    assert json.loads(to_json_bytes(report)) == report
+    fast_json, health_checks.orjson = health_checks.orjson, None
+    try:
+        assert json.loads(to_json_bytes(report)) == report
+    finally:
+        health_checks.orjson = fast_json
+    print(f"✅ Report serialized: {len(to_json_bytes(report))} bytes")
+    print("")
+
+async def test_circuit_breaker_transitions():
+    """Test circuit breaker state transitions"""
+    print("\n⚡ Testing Circuit Breaker Transitions")
+    print("=" * 50)
+    
+    breaker = CircuitBreaker(
+        "integration_test", CircuitBreakerConfig(failure_threshold=2, recovery_timeout=0.05, success_threshold=1)
+    )
+    
+    async def failing():
+        await asyncio.sleep(0)  # Let the other calls in before failing
+        raise ValueError("downstream unavailable")
     
+    async def succeeding():
+        return "ok"
+    
+    labels = {"circuit_name": "integration_test"}
+    trips = lambda: REGISTRY.get_sample_value("circuit_breaker_trips_total", labels)
+    state = lambda: REGISTRY.get_sample_value("circuit_breaker_state", labels)
+    trips_before = trips()
+    
+    # Concurrent calls admitted while closed all fail together; the breaker trips once
+    outcomes = await asyncio.gather(*(breaker.call(failing) for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(outcome, ValueError) for outcome in outcomes), outcomes
+    assert breaker.state is CircuitState.OPEN
+    assert trips() == trips_before + 1
+    assert state() == 1
+    
+    try:
+        await breaker.call(succeeding)
+    except AgentError:
+        pass
+    else:
+        raise AssertionError("open breaker let a call through")
+    print("✅ Opened once under concurrent failures and rejects calls")
+    
+    await asyncio.sleep(0.06)
+    assert await breaker.call(succeeding) == "ok"
+    assert breaker.state is CircuitState.CLOSED
+    assert state() == 0
+    print("✅ Half-open probe succeeded, breaker closed")
     print("")
 
+# Report buffer of the suite running in the current task, set while suites run concurrently
+_suite_buffer: ContextVar[Optional[io.StringIO]] = ContextVar("suite_buffer", default=None)
+
+class _SuiteStdout:
+    """stdout stand-in that sends print() output to the running suite's buffer"""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text):
+        buffer = _suite_buffer.get()
+        return (self._stream if buffer is None else buffer).write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+async def _buffered(suite) -> str:
+    """Await a suite coroutine and return its captured report"""
+    buffer = io.StringIO()
+    _suite_buffer.set(buffer)  # each suite runs in its own task context
+    await suite
+    return buffer.getvalue()
+
+async def _write_reports(reports: asyncio.Queue, stream):
+    """Single writer task for finished suite reports"""
+    while True:
+        report = await reports.get()
+        stream.write(report)
+        stream.flush()
+        reports.task_done()
+
+async def run_concurrently(*suites):
+    """Run independent suite coroutines concurrently, printing each report in order once it is ready"""
+    stdout = sys.stdout
+    reports: asyncio.Queue = asyncio.Queue()
+    writer = asyncio.create_task(_write_reports(reports, stdout))
+    sys.stdout = _SuiteStdout(stdout)
+    try:
+        # A failing suite cancels the others and surfaces in an ExceptionGroup
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(_buffered(suite)) for suite in suites]
+            for task in tasks:
+                reports.put_nowait(await task)
+    finally:
+        sys.stdout = stdout
+        await reports.join()
+        writer.cancel()
+
 async def main():
     """Run all tests"""
     print("🚀 AgentNativeFramework Swarm-Hive Integration Test Suite")
     print("=" * 70)
     
-    # Run all test suites
-    await test_swarm_functionality()
-    await test_hive_intelligence()
-    await test_swarm_hive_hybrid()
-    await test_adaptive_coordination()
-    await test_agent_manager_integration()
-    await test_system_status_monitoring()
+    # On Python 3.12+ new tasks start running right away, so coordinations that finish
+    # without suspending complete inside create_task instead of a loop turn later
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
     
-    print("🎉 All tests completed successfully!")
-    print("=" * 70)
+    # One agent manager and coordinator serve every suite
+    agent_manager = AgentManager.default()
     
-    print("\n📋 Summary:")
-    print("✅ Swarm coordination working")
-    print("✅ Hive intelligence operational")
-    print("✅ Hybrid coordination functional")
-    print("✅ Adaptive mode selection active")
-    print("✅ Agent manager integration complete")
-    print("✅ System monitoring enabled")
-    
-    print("\n🔮 The swarm and hive functions have been successfully added!")
-    print("You can now use:")
-    print("   - SwarmManager for swarm intelligence")
-    print("   - HiveIntelligence for collective decision-making")
-    print("   - SwarmHiveCoordinator for integrated coordination")
-    print("   - Enhanced AgentManager with swarm-hive capabilities")
+    # Swarm functionality runs first; the remaining suites use distinct task
+    # and swarm ids, so their waits can overlap
+    await test_swarm_functionality(agent_manager)
+    coordinator = SwarmHiveCoordinator(agent_manager)
+    agent_manager.swarm_hive_coordinator = coordinator
+    await run_concurrently(
+        test_hive_intelligence(),
+        test_swarm_hive_hybrid(coordinator),
+        test_adaptive_coordination(coordinator),
+        test_agent_manager_integration(agent_manager),
+        test_system_status_monitoring(coordinator),
+        test_daemon_bridge_framing(),
+        test_health_status_reporting(),
+        test_circuit_breaker_transitions()
+    )
+    
+    sys.stdout.write(
+        "🎉 All tests completed successfully!\n"
+        + "=" * 70 + "\n"
+        "\n📋 Summary:\n"
+        "✅ Swarm coordination working\n"
+        "✅ Hive intelligence operational\n"
+        "✅ Hybrid coordination functional\n"
+        "✅ Adaptive mode selection active\n"
+        "✅ Agent manager integration complete\n"
+        "✅ System monitoring enabled\n"
+        "\n🔮 The swarm and hive functions have been successfully added!\n"
+        "You can now use:\n"
+        "   - SwarmManager for swarm intelligence\n"
+        "   - HiveIntelligence for collective decision-making\n"
+        "   - SwarmHiveCoordinator for integrated coordination\n"
+        "   - Enhanced AgentManager with swarm-hive capabilities\n"
+    )
 
 if __name__ == "__main__":
-    # Add numpy requirement check
-    try:
-        import numpy as np
+    # Add numpy requirement check, without importing it
+    if importlib.util.find_spec("numpy") is not None:
         print("✅ NumPy available")
-    except ImportError:
+    else:
         print("⚠️ NumPy not found - install with: pip install numpy")
     
+    # Use the libuv event loop when available
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     # Run the test suite
     asyncio.run(main())
\ No newline at end of file